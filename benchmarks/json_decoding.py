@@ -0,0 +1,53 @@
+"""
+Compares the JSON decoders of Http on a large Elasticsearch-like response.
+
+Usage: python benchmarks/json_decoding.py [number of hits]
+"""
+
+import json
+import sys
+import timeit
+
+from nexussdk.utils.http import Http
+
+
+def es_response(hits: int) -> bytes:
+    return json.dumps({
+        "took": 12,
+        "timed_out": False,
+        "hits": {
+            "total": {"value": hits, "relation": "eq"},
+            "max_score": 1.0,
+            "hits": [{
+                "_index": "kg_index",
+                "_id": "https://bbp.epfl.ch/neurosciencegraph/data/%d" % i,
+                "_score": 1.0,
+                "_source": {
+                    "@id": "https://bbp.epfl.ch/neurosciencegraph/data/%d" % i,
+                    "@type": ["Dataset", "Entity"],
+                    "name": "dataset %d" % i,
+                    "description": "a dataset with a description which is a bit longer than the name %d" % i,
+                    "distribution": [{"contentSize": {"unitCode": "bytes", "value": i * 1024},
+                                      "encodingFormat": "application/json", "name": "file%d.json" % i}],
+                    "_rev": 3,
+                    "_deprecated": False,
+                    "_createdAt": "2019-09-12T09:45:23.418Z",
+                    "_createdBy": "https://bbp.epfl.ch/nexus/v1/realms/bbp/users/someone",
+                },
+            } for i in range(hits)],
+        },
+    }).encode("utf-8")
+
+
+def main():
+    hits = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    payload = es_response(hits)
+    repeat = 5
+    print("%d hits, %.1f MiB, best of %d" % (hits, len(payload) / 1024 ** 2, repeat))
+    for name, decode in Http.json_decoders.items():
+        duration = min(timeit.repeat(lambda: decode(payload), number=1, repeat=repeat))
+        print("%-10s %8.1f ms" % (name, duration * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,3 +4,7 @@ from nexussdk.utils import tools
 # Expose this error so that a user of the nexus sdk can refer to it as nexussdk.HTTPError
 # and does not have to figure out from what lib it comes from
 from requests.exceptions import HTTPError
+# Raised when the digest of a file differs from the one known by Nexus
+from nexussdk.files import DigestMismatchError
+# Raised instead of sending a request to an endpoint which keeps failing
+from nexussdk.utils.circuit_breaker import CircuitOpenError
@@ -1,7 +1,7 @@
-from typing import Optional
+from typing import Callable, Optional
 
 from nexussdk.acls import Acls
-from nexussdk.files import Files
+from nexussdk.files import AsyncFiles, Files
 from nexussdk.identities import Identities
 from nexussdk.organizations import Organizations
 from nexussdk.permissions import Permissions
@@ -11,15 +11,99 @@ from nexussdk.resources import Resources
 from nexussdk.resolvers import Resolvers
 from nexussdk.schemas import Schemas
 from nexussdk.storages import Storages
+from nexussdk.utils.async_http import AsyncHttp
+from nexussdk.utils.file_cache import FileCache
 from nexussdk.utils.http import Http
+from nexussdk.utils.instrumentation import RequestEvent
+from nexussdk.utils.metrics import MetricsRegistry
+from nexussdk.utils.resource_cache import ResourceCache
 from nexussdk.views import Views
 
 
 class NexusClient:
-    def __init__(self, environment: str, token: Optional[str] = None):
-        self._http = Http(environment, token)
+    def __init__(self, environment: str, token: Optional[str] = None, file_cache: Optional[FileCache] = None,
+                 metrics: Optional[MetricsRegistry] = None, resource_cache: Optional[ResourceCache] = None,
+                 **http_options):
+        """
+            :param environment: base URL of the Nexus deployment (e.g. https://nexus.example.org/v1)
+            :param token: OPTIONAL bearer token used to authenticate the requests
+            :param file_cache: OPTIONAL local cache of the file binaries fetched with files.fetch
+            :param resource_cache: OPTIONAL in-memory cache of the resources fetched with resources.fetch, see
+                resources.watch
+            :param metrics: OPTIONAL registry aggregating the measures of the requests of the client
+            :param http_options: OPTIONAL settings passed to Http, e.g. for the connections (pool_maxsize, timeout,
+                keep_alive, ...), the JSON decoding (json_decoder) or the compression (compression). See Http for the
+                complete list. The resulting connection pool is shared by all the sub-APIs.
+        """
+        self._http = Http(environment, token, **http_options)
+        self.metrics = metrics
+        if metrics is not None:
+            self._http.add_hook(metrics.observe)
         self.acls = Acls(self._http)
-        self.files = Files(self._http)
+        self.files = Files(self._http, file_cache)
+        self.identities = Identities(self._http)
+        self.organizations = Organizations(self._http)
+        self.permissions = Permissions(self._http)
+        self.projects = Projects(self._http)
+        self.realms = Realms(self._http)
+        self.resolvers = Resolvers(self._http)
+        self.resources = Resources(self._http, resource_cache)
+        self.schemas = Schemas(self._http)
+        self.storages = Storages(self._http)
+        self.views = Views(self._http)
+
+    def close(self):
+        """
+            Close the connections kept alive by the client. The client should not be used afterwards.
+        """
+        if self.resources.cache is not None:
+            self.resources.cache.stop()
+        self._http.close()
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+            Register a function called with the measures of every request sent by the client, see Http.add_hook.
+
+            :param hook: function taking a RequestEvent
+        """
+        self._http.add_hook(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+            Unregister a function registered with add_hook.
+        """
+        self._http.remove_hook(hook)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncNexusClient:
+    def __init__(self, environment: str, token: Optional[str] = None, metrics: Optional[MetricsRegistry] = None,
+                 **http_options):
+        """
+            Asynchronous counterpart of NexusClient: the sub-APIs are the same but their methods must be awaited.
+            Events are still returned as synchronous iterators. The helpers built on the results of several requests
+            or on a synchronous stream (iter_list, Resources.create_many, Files.content, Files.upload_tree,
+            Views.iter_query_es) are only available with NexusClient and raise a TypeError.
+
+            :param environment: base URL of the Nexus deployment (e.g. https://nexus.example.org/v1)
+            :param token: OPTIONAL bearer token used to authenticate the requests
+            :param metrics: OPTIONAL registry aggregating the measures of the requests of the client
+            :param http_options: OPTIONAL settings passed to AsyncHttp, e.g. for the connections (max_concurrency,
+                pool_maxsize, timeout, ...), the JSON decoding (json_decoder) or the compression (compression). See
+                AsyncHttp for the complete list. The resulting connection pool and concurrency limit are shared by all
+                the sub-APIs.
+        """
+        self._http = AsyncHttp(environment, token, **http_options)
+        self.metrics = metrics
+        if metrics is not None:
+            self._http.add_hook(metrics.observe)
+        self.acls = Acls(self._http)
+        self.files = AsyncFiles(self._http)
         self.identities = Identities(self._http)
         self.organizations = Organizations(self._http)
         self.permissions = Permissions(self._http)
@@ -30,3 +114,29 @@ class NexusClient:
         self.schemas = Schemas(self._http)
         self.storages = Storages(self._http)
         self.views = Views(self._http)
+
+    async def close(self):
+        """
+            Close the connections kept alive by the client. The client should not be used afterwards.
+        """
+        await self._http.close()
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+            Register a function called with the measures of every request sent by the client, see Http.add_hook.
+
+            :param hook: function taking a RequestEvent
+        """
+        self._http.add_hook(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+            Unregister a function registered with add_hook.
+        """
+        self._http.remove_hook(hook)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
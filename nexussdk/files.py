@@ -3,27 +3,45 @@ Files are a particular kind of resource that contain binary data. In addition, l
 to a project (and thus, an organization) and can be described with their metadata.
 """
 
+import hashlib
+import json
 import os
-from typing import Dict, Optional
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import quote_plus as url_encode
 
 import puremagic
+import requests
 
+from nexussdk.utils.file_cache import FileCache
 from nexussdk.utils.http import Http
+from nexussdk.utils.multipart import MultipartFile
+from nexussdk.utils.pagination import iter_results
+from nexussdk.utils.parallel import parallel_map
 
 
 class Files:
     segment = "files"
     _default_content_type = "application/octet-stream"
 
-    def __init__(self, http: Http):
+    def __init__(self, http: Http, cache: Optional[FileCache] = None):
+        """
+            :param http: the Http instance used to send the requests
+            :param cache: OPTIONAL local cache of the binaries, keyed by their digest (default: None, no cache)
+        """
         self._http = http
+        self.cache = cache
 
     def fetch(self, org_label: str, project_label: str, file_id: str, rev: Optional[int] = None,
-              tag: Optional[str] = None, out_filepath: Optional[str] = None) -> Dict:
+              tag: Optional[str] = None, out_filepath: Optional[str] = None, workers: int = 1,
+              chunk_size: int = 1024 * 1024, part_size: int = 64 * 1024 * 1024, resume: bool = False,
+              verify: bool = True) -> Dict:
         """
-            Fetches a distant file and returns the metadata of this file. In addition, if the argument `out_filepath` can
-            be of three forms:
+            Fetches a distant file and returns the metadata of this file. The binary is only requested when
+            `out_filepath` is provided, use `content` to read it without writing it to disk.
+            The argument `out_filepath` can be of three forms:
             - out_filepath=None (default): the binary is not fetched
             - out_filepath="./some/folder/" the binary is fetched and written in this dir with it's original filename
             - out_filepath="./somefile.jpg" the binary is fetched and written under this exact filename
@@ -36,7 +54,19 @@ class Files:
             :param rev: OPTIONAL fetches a specific revision of a file (default: None, fetches the last)
             :param tag: OPTIONAL fetches the file version that has a specific tag (default: None)
             :param out_filepath: OPTIONAL the filename to write (default: None)
+            :param workers: OPTIONAL number of byte ranges of the binary downloaded concurrently. Values above 1 are
+                meant for large files, see FileContent.save (default: 1)
+            :param chunk_size: OPTIONAL size in bytes of the chunks read from the network (default: 1 MiB)
+            :param part_size: OPTIONAL size in bytes of the byte ranges downloaded concurrently (default: 64 MiB)
+            :param resume: OPTIONAL if True, resume an interrupted download of the same revision of the file into
+                the same `out_filepath`, see FileContent.save (default: False)
+            :param verify: OPTIONAL if True, the digest of the binary is computed while it is written and a
+                DigestMismatchError is raised if it differs from the `_digest` of the file (default: True)
             :return: Payload of the whole file as a dictionary
+
+            When the Files instance has a cache, the binary is looked up in the cache with the `_digest` of the
+            metadata and, if present, exported to `out_filepath` without being downloaded. Otherwise it is
+            downloaded into the cache first.
         """
 
         if rev is not None and tag is not None:
@@ -50,19 +80,63 @@ class Files:
         path = [self.segment, org_label, project_label, file_id]
 
         response_metadata = self._http.get(path, rev=rev, tag=tag)
-        response_binary = self._http.get(path, get_raw_response=True, accept="all", stream=True, rev=rev, tag=tag)
 
         if out_filepath is not None:
             if os.path.isdir(out_filepath):
                 out_filepath = os.path.join(out_filepath, response_metadata["_filename"])
 
-            # we write the result of the request into a file
-            with open(out_filepath, "wb") as f:
-                for chunk in response_binary.iter_content(chunk_size=4096):
-                    f.write(chunk)
+            content = FileContent(self._http, path, rev=rev, tag=tag, metadata=response_metadata)
+            digest = response_metadata.get("_digest") or {}
+            if self.cache is not None and digest.get("_algorithm") and digest.get("_value"):
+                cached_filepath = self.cache.get(digest["_algorithm"], digest["_value"])
+                if cached_filepath is None:
+                    cached_filepath = self.cache.put(
+                        digest["_algorithm"], digest["_value"],
+                        lambda filepath: content.save(filepath, chunk_size, workers, part_size, resume, verify),
+                        temporary_suffix=".part" if resume else None)
+                self.cache.export(cached_filepath, out_filepath)
+            else:
+                content.save(out_filepath, chunk_size, workers, part_size, resume, verify)
 
         return response_metadata
 
+    def content(self, org_label: str, project_label: str, file_id: str, rev: Optional[int] = None,
+                tag: Optional[str] = None) -> "FileContent":
+        """
+            Returns a lazy handle on the binary of a distant file. No request is sent until the content is read.
+
+            :param org_label: The label of the organization that the file belongs to
+            :param project_label: The label of the project that the file belongs to
+            :param file_id: id of the file
+            :param rev: OPTIONAL the revision of the file to read (default: None, reads the last)
+            :param tag: OPTIONAL the tag of the file to read (default: None)
+            :return: a FileContent handle
+        """
+        self._http.require_sync("Files.content")
+
+        if rev is not None and tag is not None:
+            raise Exception("The arguments rev and tag are mutually exclusive. One or the other must be chosen.")
+
+        path = [self.segment, url_encode(org_label), url_encode(project_label), url_encode(file_id)]
+        return FileContent(self._http, path, rev=rev, tag=tag)
+
+    def content_(self, file: Dict, rev: Optional[int] = None) -> "FileContent":
+        """
+            Returns a lazy handle on the binary of a file from an existing file resource payload, for instance the
+            value returned by nexus.file.fetch(). No request is sent until the content is read.
+
+            :param file: Payload of a previously fetched file.
+            :param rev: OPTIONAL the revision of the file to read. If not provided, the rev from the file argument
+                will be used.
+            :return: a FileContent handle
+        """
+        self._http.require_sync("Files.content_")
+
+        if rev is None:
+            rev = file["_rev"]
+
+        return FileContent(self._http, file["_self"], rev=rev, metadata=file if rev == file["_rev"] else None)
+
     def create(self, org_label: str, project_label: str, filepath: str, storage_id: Optional[str] = None,
                file_id: Optional[str] = None, filename: Optional[str] = None,
                content_type: Optional[str] = None) -> Dict:
@@ -91,15 +165,76 @@ class Files:
         if filename is None:
             filename = filepath.split("/")[-1]
 
-        file_obj = {
-            "file": (filename, open(filepath, "rb"), self._content_type(filepath, content_type))
-        }
-
         if file_id is None:
-            return self._http.post(path, body=file_obj, data_type="file", storage=storage_id)
+            return self._upload(self._http.post, path, filepath, filename, content_type, storage=storage_id)
         else:
             path.append(url_encode(file_id))
-            return self._http.put(path, body=file_obj, data_type="file", storage=storage_id)
+            return self._upload(self._http.put, path, filepath, filename, content_type, storage=storage_id)
+
+    def upload_tree(self, org_label: str, project_label: str, local_dir: str, storage_id: Optional[str] = None,
+                    workers: int = 4, retries: int = 3,
+                    progress: Optional[Callable[[Dict], None]] = None) -> Dict[str, Dict]:
+        """
+            Uploads all the files of a local directory and its sub-directories, with a bounded number of uploads in
+            flight. The directory tree is walked lazily, so it is never listed in memory as a whole.
+            An upload failing with a connection error, a timeout, a 429 or a 5xx status is retried with an
+            exponential backoff. The ids of the files are generated by the client, so that the retry of an upload
+            which was processed although it failed is recognized (409 Conflict) instead of creating a duplicate.
+
+            :param org_label: The label of the organization that the files belong to
+            :param project_label: The label of the project that the files belong to
+            :param local_dir: path of the directory to upload
+            :param storage_id: OPTIONAL The id of the storage backend where the files will be stored.
+                               If not provided, the project's default storage is used.
+            :param workers: OPTIONAL number of files uploaded at the same time (default: 4)
+            :param retries: OPTIONAL number of times the upload of a file is retried (default: 3)
+            :param progress: OPTIONAL function called after each file with a dictionary holding the number of
+                files uploaded ("files"), failed ("errors"), the number of bytes uploaded ("bytes"), the elapsed
+                time in seconds ("elapsed") and the throughput in bytes per second ("bytes_per_second")
+            :return: A manifest mapping the local path of each file to the "@id" and "_rev" of the created file
+                resource, or to an "error" message if the file could not be uploaded
+        """
+        self._http.require_sync("Files.upload_tree")
+
+        def walk():
+            for directory, _, filenames in os.walk(local_dir):
+                for filename in sorted(filenames):
+                    yield os.path.join(directory, filename)
+
+        def upload(filepath):
+            file_id = str(uuid.uuid4())
+            for attempt in range(retries + 1):
+                try:
+                    return self.create(org_label, project_label, filepath, storage_id=storage_id, file_id=file_id)
+                except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                    if attempt and isinstance(e, requests.HTTPError) and e.response is not None \
+                            and e.response.status_code == 409:
+                        # created by a previous attempt
+                        return self.fetch(org_label, project_label, file_id)
+                    transient = not isinstance(e, requests.HTTPError) or e.response is None \
+                        or e.response.status_code == 429 or e.response.status_code >= 500
+                    if not transient or attempt == retries:
+                        raise
+                    time.sleep(0.5 * 2 ** attempt)
+
+        manifest = {}
+        stats = {"files": 0, "errors": 0, "bytes": 0, "elapsed": 0.0, "bytes_per_second": 0.0}
+        start = time.monotonic()
+        filepaths = walk()
+        for _, (filepath, result) in parallel_map(lambda f: (f, _outcome(upload, f)), filepaths, workers=workers,
+                                                  ordered=False):
+            if isinstance(result, Exception):
+                manifest[filepath] = {"error": str(result)}
+                stats["errors"] += 1
+            else:
+                manifest[filepath] = {"@id": result["@id"], "_rev": result["_rev"]}
+                stats["files"] += 1
+                stats["bytes"] += os.path.getsize(filepath)
+            if progress is not None:
+                stats["elapsed"] = time.monotonic() - start
+                stats["bytes_per_second"] = stats["bytes"] / stats["elapsed"] if stats["elapsed"] else 0.0
+                progress(dict(stats))
+        return manifest
 
     def create_link(self, org_label: str, project_label: str, filename: str, filepath: str, media_type: str,
                     storage_id: Optional[str] = None, file_id: Optional[str] = None) -> Dict:
@@ -166,11 +301,7 @@ class Files:
         if filename is None:
             filename = filepath.split("/")[-1]
 
-        file_obj = {
-            "file": (filename, open(filepath, "rb"), self._content_type(filepath, content_type))
-        }
-
-        return self._http.put(path, body=file_obj, data_type="file", rev=rev, storage=storage_id)
+        return self._upload(self._http.put, path, filepath, filename, content_type, rev=rev, storage=storage_id)
 
     def update_(self, file: Dict, filepath: str, rev: Optional[int] = None, storage_id: Optional[str] = None,
                 content_type: Optional[str] = None) -> Dict:
@@ -194,9 +325,8 @@ class Files:
 
         path = file["_self"]
 
-        file_obj = {"file": (file["_filename"], open(filepath, "rb"), self._content_type(filepath, content_type))}
-
-        return self._http.put(path, body=file_obj, data_type="file", rev=rev, storage=storage_id)
+        return self._upload(self._http.put, path, filepath, file["_filename"], content_type, rev=rev,
+                            storage=storage_id)
 
     def update_link(self, org_label: str, project_label: str, filename: str, filepath: str, media_type: str, rev: int,
                     file_id: str, storage_id: Optional[str] = None) -> Dict:
@@ -301,6 +431,27 @@ class Files:
 
         return self._http.get(path, params=params)
 
+    def iter_list(self, org_label: str, project_label: str, pagination_from: int = 0, pagination_size: int = 20,
+                  deprecated: Optional[bool] = None, type: Optional[str] = None, rev: Optional[int] = None,
+                  schema: Optional[str] = None, created_by: Optional[str] = None, updated_by: Optional[str] = None,
+                  file_id: Optional[str] = None, max_pages: int = 1) -> Iterator[Dict]:
+        """
+            Iterate over the files available for a given organization and project, fetching the pages lazily.
+            See `list` for the filtering arguments.
+
+            :param pagination_from: OPTIONAL The pagination index to start from (default: 0)
+            :param pagination_size: OPTIONAL The number of files fetched per page (default: 20)
+            :param max_pages: OPTIONAL maximum number of pages held in memory. If greater than 1, the next pages are
+                fetched in the background while the current one is consumed (default: 1)
+            :return: iterator of the listed files
+        """
+
+        def fetch_page(page_from, page_size):
+            return self.list(org_label, project_label, page_from, page_size, deprecated, type, rev, schema,
+                             created_by, updated_by, file_id)
+
+        return iter_results(self._http, fetch_page, pagination_from, pagination_size, max_pages)
+
     def deprecate(self, org_label: str, project_label: str, file_id: str, rev: int) -> Dict:
         """
             Deprecate a file.
@@ -392,6 +543,21 @@ class Files:
         path = file["_self"] + "/tags"
         return self._http.get(path)
 
+    def _upload(self, send: Callable, path, filepath: str, filename: str, content_type: Optional[str], **params):
+        # the file is streamed from disk while being sent and closed once the request is over
+        with MultipartFile(filepath, filename, self._content_type(filepath, content_type)) as body:
+            metadata = send(path, body=body, data_type="file", **params)
+        self._verify_upload(metadata, body)
+        return metadata
+
+    def _verify_upload(self, metadata: Dict, body: MultipartFile) -> None:
+        """
+            Checks the digest computed while sending a file against the one returned by Nexus, if any.
+        """
+        digest = _Digest.of(metadata)
+        if digest is not None and body.hexdigest() is not None and body.digest_algorithm == digest.name:
+            digest.verify(metadata["@id"], body.hexdigest())
+
     def _content_type(self, filepath: str, content_type: Optional[str]) -> str:
         if content_type is None:
             try:
@@ -402,3 +568,417 @@ class Files:
             return guessed_content_type
         else:
             return content_type
+
+
+class FileContent:
+    """
+        Lazy handle on the binary of a file. The request is only sent when the content is first read, and the
+        connection is given back to the pool as soon as the content has been entirely read or the handle is closed.
+        The content can be read only once.
+
+        Usage:
+            with nexus.files.content(org, project, file_id) as content:
+                for chunk in content.iter_chunks():
+                    ...
+    """
+
+    def __init__(self, http: Http, path, rev: Optional[int] = None, tag: Optional[str] = None,
+                 metadata: Optional[Dict] = None):
+        self._http = http
+        self._path = path
+        self._rev = rev
+        self._tag = tag
+        self._metadata = metadata
+        self._response = None
+
+    def iter_chunks(self, chunk_size: int = 1024 * 1024, verify: bool = True) -> Iterator[bytes]:
+        """
+            Streams the binary. When the metadata of the file is known, the digest of the binary is computed while
+            streaming and checked against the `_digest` of the metadata once the binary has been entirely read.
+
+            :param chunk_size: OPTIONAL size in bytes of the chunks (default: 1 MiB)
+            :param verify: OPTIONAL if True, check the digest of the binary (default: True)
+            :return: iterator of chunks of bytes
+        """
+        if self._response is None:
+            self._open()
+        digest = _Digest.of(self._metadata) if verify else None
+        try:
+            for chunk in self._response.iter_content(chunk_size=chunk_size):
+                if digest is not None:
+                    digest.update(chunk)
+                yield chunk
+            if digest is not None:
+                digest.verify(self._metadata["_self"])
+        finally:
+            self.close()
+
+    def read(self, verify: bool = True) -> bytes:
+        """
+            Reads the whole binary in memory.
+
+            :param verify: OPTIONAL if True, check the digest of the binary (default: True)
+            :return: the binary content
+        """
+        return b"".join(self.iter_chunks(verify=verify))
+
+    def save(self, out_filepath: str, chunk_size: int = 1024 * 1024, workers: int = 1,
+             part_size: int = 64 * 1024 * 1024, resume: bool = False, verify: bool = True) -> None:
+        """
+            Streams the binary into a file.
+
+            With more than one worker, the binary is split into byte ranges of `part_size` bytes which are
+            downloaded concurrently and written in place into the output file. If the server does not honour
+            Range requests, or if the metadata of the file shows that it fits in one byte range, the binary is streamed
+            through a single connection instead.
+
+            With `resume`, the binary is always downloaded by byte ranges and the completed ranges are recorded in
+            a sidecar file next to the output file (suffixed with `.nexus-partial`). If the download is interrupted,
+            saving again the same revision of the file to the same path only downloads the missing ranges.
+            The sidecar is deleted once the download is complete. Resuming requires the metadata of the file.
+
+            When the metadata of the file is known, the digest of the binary is checked against its `_digest` and a
+            DigestMismatchError is raised if they differ. A single stream is hashed while it is written. Byte ranges
+            are hashed in order as soon as they are written, while the next ranges are still being downloaded. The
+            output file is removed when its digest differs.
+
+            :param out_filepath: the filename to write
+            :param chunk_size: OPTIONAL size in bytes of the chunks read from the network (default: 1 MiB)
+            :param workers: OPTIONAL number of byte ranges downloaded concurrently (default: 1)
+            :param part_size: OPTIONAL size in bytes of the byte ranges (default: 64 MiB). When resuming, the part
+                size of the interrupted download is used.
+            :param resume: OPTIONAL if True, resume an interrupted download of the binary (default: False)
+            :param verify: OPTIONAL if True, check the digest of the binary (default: True)
+        """
+        try:
+            self._save(out_filepath, chunk_size, workers, part_size, resume, verify)
+        except DigestMismatchError:
+            # the binary written is corrupt, it must not be mistaken for the file
+            _remove(out_filepath)
+            raise
+
+    def close(self) -> None:
+        """
+            Releases the connection if the binary was requested.
+        """
+        if self._response is not None:
+            self._response.close()
+
+    def _save(self, out_filepath: str, chunk_size: int, workers: int, part_size: int, resume: bool,
+              verify: bool) -> None:
+        if resume:
+            self._save_resumable(out_filepath, chunk_size, workers, part_size, verify)
+            return
+        size = (self._metadata or {}).get("_bytes")
+        # a binary which fits in one byte range is streamed directly, without the round trip of a range request
+        if workers > 1 and self._response is None and (size is None or size > part_size):
+            total = self._open_range(0, part_size - 1)
+            if total is not None:
+                with open(out_filepath, "wb") as f:
+                    f.truncate(total)
+                digest = _Digest.of(self._metadata) if verify else None
+                for bounds in self._download_ranges(out_filepath, _byte_ranges(total, part_size), chunk_size,
+                                                    workers):
+                    if digest is not None:
+                        digest.update_from_file(out_filepath, bounds, chunk_size)
+                if digest is not None:
+                    digest.verify(self._metadata["_self"])
+                return
+        with open(out_filepath, "wb") as f:
+            for chunk in self.iter_chunks(chunk_size, verify):
+                f.write(chunk)
+
+    def _open(self, headers: Optional[Dict] = None):
+        self._response = self._http.get(self._path, get_raw_response=True, accept="all", stream=True,
+                                        headers=headers, rev=self._rev, tag=self._tag)
+        return self._response
+
+    def _open_range(self, start: int, end: int) -> Optional[int]:
+        """
+            Requests a byte range and returns the total size of the binary, or None if the server sent the whole
+            binary instead, in which case the response can be streamed as usual.
+        """
+        try:
+            response = self._open({"Range": "bytes=%d-%d" % (start, end), "Accept-Encoding": "identity"})
+        except requests.HTTPError as e:
+            # the range of an empty binary is not satisfiable
+            if e.response is None or e.response.status_code != 416:
+                raise
+            self._open()
+            return None
+        if response.status_code != 206:
+            return None
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        if not total.isdigit():
+            # the total size is unknown, a partial response cannot be used for a plain download
+            response.close()
+            self._open()
+            return None
+        return int(total)
+
+    def _save_resumable(self, out_filepath: str, chunk_size: int, workers: int, part_size: int,
+                        verify: bool) -> None:
+        if self._metadata is None:
+            raise Exception("Resuming a download requires the metadata of the file.")
+        state = _DownloadState(out_filepath, self._metadata, part_size)
+        total = self._metadata["_bytes"]
+        all_ranges = _byte_ranges(total, state.part_size)
+        resumed = set(state.completed)
+        ranges = [bounds for bounds in all_ranges if bounds not in resumed]
+        if not resumed:
+            with open(out_filepath, "wb") as f:
+                f.truncate(total)
+        if ranges and self._open_range(*ranges[0]) is None:
+            # the server does not honour Range requests, nothing can be resumed
+            state.remove()
+            with open(out_filepath, "wb") as f:
+                for chunk in self.iter_chunks(chunk_size, verify):
+                    f.write(chunk)
+            return
+        digest = _Digest.of(self._metadata) if verify else None
+        downloads = self._download_ranges(out_filepath, ranges, chunk_size, workers, state.add) if ranges else None
+        try:
+            # the ranges downloaded before the interruption are hashed while the missing ones are downloaded
+            for bounds in all_ranges:
+                if bounds not in resumed:
+                    next(downloads)
+                if digest is not None:
+                    digest.update_from_file(out_filepath, bounds, chunk_size)
+        finally:
+            if downloads is not None:
+                downloads.close()
+        state.remove()
+        if digest is not None:
+            digest.verify(self._metadata["_self"])
+
+    def _download_ranges(self, out_filepath: str, ranges: List[Tuple[int, int]], chunk_size: int, workers: int,
+                         on_range: Optional[Callable[[Tuple[int, int]], None]] = None) -> Iterator[Tuple[int, int]]:
+        """
+            Downloads byte ranges concurrently into the output file and yields them in order once written.
+        """
+        # the first range has already been requested to check that the server honours Range requests
+        first = self._response
+
+        def download(bounds):
+            start, end = bounds
+            if bounds == ranges[0]:
+                response = first
+            else:
+                response = self._http.get(self._path, get_raw_response=True, accept="all", stream=True,
+                                          headers={"Range": "bytes=%d-%d" % (start, end),
+                                                   "Accept-Encoding": "identity"},
+                                          rev=self._rev, tag=self._tag)
+            written = 0
+            with response, open(out_filepath, "r+b") as f:
+                if response.status_code != 206:
+                    raise Exception("The server did not honour the Range request bytes=%d-%d." % (start, end))
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+            if written != end - start + 1:
+                raise Exception("Incomplete byte range %d-%d: received %d bytes." % (start, end, written))
+            if on_range is not None:
+                on_range(bounds)
+
+        try:
+            for index, result in parallel_map(download, ranges, workers=workers, window=workers):
+                if isinstance(result, Exception):
+                    raise result
+                yield ranges[index]
+        finally:
+            first.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class DigestMismatchError(Exception):
+    """
+        Raised when the digest computed on the binary of a file differs from the one known by Nexus.
+    """
+
+    def __init__(self, file: str, algorithm: str, expected: str, actual: str):
+        super().__init__("The %s digest of %s is %s but %s was expected." % (algorithm, file, actual, expected))
+        self.file = file
+        self.algorithm = algorithm
+        self.expected = expected
+        self.actual = actual
+
+
+class _Digest:
+    """
+        Digest of a binary computed incrementally, to be checked against the `_digest` of its Nexus metadata.
+    """
+
+    def __init__(self, algorithm: str, expected: str):
+        # Nexus names the algorithms as Java does (e.g. SHA-256)
+        self.name = algorithm.replace("-", "").lower()
+        self._hash = hashlib.new(self.name)
+        self.algorithm = algorithm
+        self.expected = expected
+
+    @staticmethod
+    def of(metadata: Optional[Dict]) -> Optional["_Digest"]:
+        """
+            Returns a digest to compute for a file, or None if Nexus does not know the digest of the file or if the
+            algorithm is not available.
+        """
+        digest = (metadata or {}).get("_digest") or {}
+        if not digest.get("_algorithm") or not digest.get("_value"):
+            return None
+        try:
+            return _Digest(digest["_algorithm"], digest["_value"])
+        except ValueError:
+            return None
+
+    def update(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+
+    def update_from_file(self, filepath: str, bounds: Tuple[int, int], chunk_size: int) -> None:
+        start, end = bounds
+        with open(filepath, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                self._hash.update(chunk)
+                remaining -= len(chunk)
+
+    def verify(self, file: str, actual: Optional[str] = None) -> None:
+        actual = actual or self._hash.hexdigest()
+        if actual != self.expected:
+            raise DigestMismatchError(file, self.algorithm, self.expected, actual)
+
+
+class _DownloadState:
+    """
+        Sidecar file recording the byte ranges of a binary already written to disk, so that an interrupted download
+        can be resumed. The recorded ranges are only trusted if they belong to the same revision of the same file.
+    """
+    suffix = ".nexus-partial"
+
+    def __init__(self, out_filepath: str, metadata: Dict, part_size: int):
+        self.filepath = out_filepath + self.suffix
+        self.identity = {
+            "_self": metadata["_self"],
+            "_rev": metadata["_rev"],
+            "_digest": metadata.get("_digest", {}).get("_value"),
+            "_bytes": metadata["_bytes"],
+        }
+        self.part_size = part_size
+        self.completed = set()
+        self._lock = threading.Lock()
+        try:
+            with open(self.filepath) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = None
+        if state is not None and state["file"] == self.identity and os.path.exists(out_filepath) \
+                and os.path.getsize(out_filepath) == self.identity["_bytes"]:
+            self.part_size = state["part_size"]
+            self.completed = {tuple(bounds) for bounds in state["completed"]}
+        self._write()
+
+    def add(self, bounds: Tuple[int, int]) -> None:
+        with self._lock:
+            self.completed.add(tuple(bounds))
+            self._write()
+
+    def remove(self) -> None:
+        if os.path.exists(self.filepath):
+            os.remove(self.filepath)
+
+    def _write(self) -> None:
+        # write then rename, so that a crash never leaves a truncated sidecar
+        state = {"file": self.identity, "part_size": self.part_size, "completed": sorted(self.completed)}
+        with open(self.filepath + ".tmp", "w") as f:
+            json.dump(state, f)
+        os.replace(self.filepath + ".tmp", self.filepath)
+
+
+def _outcome(function: Callable, *args):
+    try:
+        return function(*args)
+    except Exception as e:
+        return e
+
+
+def _byte_ranges(total: int, part_size: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + part_size, total) - 1) for start in range(0, total, part_size)]
+
+
+def _remove(filepath: str) -> None:
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
+
+
+class AsyncFiles(Files):
+    """
+        Files bound to an AsyncHttp. Every method is awaitable.
+    """
+
+    async def fetch(self, org_label: str, project_label: str, file_id: str, rev: Optional[int] = None,
+                    tag: Optional[str] = None, out_filepath: Optional[str] = None, verify: bool = True) -> Dict:
+        """
+            Fetches a distant file and returns the metadata of this file. The binary is only fetched when `out_filepath`
+            is provided, it is streamed through a single connection. Unlike Files.fetch, the binary cannot be downloaded
+            by concurrent byte ranges nor resumed, and the file cache of the Files instance is not used.
+
+            :param org_label: The label of the organization that the file belongs to
+            :param project_label: The label of the project that the file belongs to
+            :param file_id: id of the file
+            :param rev: OPTIONAL fetches a specific revision of a file (default: None, fetches the last)
+            :param tag: OPTIONAL fetches the file version that has a specific tag (default: None)
+            :param out_filepath: OPTIONAL the filename to write, or the directory to write it in with its original
+                filename (default: None, the binary is not fetched)
+            :param verify: OPTIONAL if True, the digest of the binary is computed while it is written and a
+                DigestMismatchError is raised, after removing the output file, if it differs from the `_digest` of the
+                file (default: True)
+            :return: Payload of the whole file as a dictionary
+        """
+
+        if rev is not None and tag is not None:
+            raise Exception("The arguments rev and tag are mutually exclusive. One or the other must be chosen.")
+
+        # the elements composing the query URL need to be URL-encoded
+        path = [self.segment, url_encode(org_label), url_encode(project_label), url_encode(file_id)]
+
+        response_metadata = await self._http.get(path, rev=rev, tag=tag)
+
+        if out_filepath is not None:
+            if os.path.isdir(out_filepath):
+                out_filepath = os.path.join(out_filepath, response_metadata["_filename"])
+
+            digest = _Digest.of(response_metadata) if verify else None
+            response_binary = await self._http.get(path, get_raw_response=True, accept="all", rev=rev, tag=tag)
+            try:
+                with open(out_filepath, "wb") as f:
+                    async for chunk in response_binary.content.iter_chunked(4096):
+                        if digest is not None:
+                            digest.update(chunk)
+                        f.write(chunk)
+            finally:
+                response_binary.release()
+            if digest is not None:
+                try:
+                    digest.verify(response_metadata["_self"])
+                except DigestMismatchError:
+                    _remove(out_filepath)
+                    raise
+
+        return response_metadata
+
+    async def _upload(self, send: Callable, path, filepath: str, filename: str, content_type: Optional[str],
+                      **params):
+        with MultipartFile(filepath, filename, self._content_type(filepath, content_type)) as body:
+            metadata = await send(path, body=body, data_type="file", **params)
+        self._verify_upload(metadata, body)
+        return metadata
@@ -0,0 +1,269 @@
+"""
+A mirror is a local copy of the resources of a project, stored in a SQLite database. It is filled by a snapshot of the
+project, then kept in sync by the resource events of the project: each synchronization only transfers the resources
+which changed since the previous one.
+"""
+
+import json
+import queue
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from requests.exceptions import HTTPError
+
+from nexussdk.resources import Resources
+from nexussdk.utils.parallel import parallel_map
+
+_schema = """
+    CREATE TABLE IF NOT EXISTS resources (
+        id TEXT PRIMARY KEY,
+        rev INTEGER NOT NULL,
+        deprecated INTEGER NOT NULL,
+        payload TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS resources_rev ON resources (rev);
+    CREATE TABLE IF NOT EXISTS types (
+        id TEXT NOT NULL,
+        type TEXT NOT NULL,
+        PRIMARY KEY (id, type)
+    );
+    CREATE INDEX IF NOT EXISTS types_type ON types (type);
+    CREATE TABLE IF NOT EXISTS checkpoint (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+"""
+
+
+class ProjectMirror:
+    """
+        Local copy of the resources of a project, in a SQLite database with the full payloads of the resources indexed
+        by id, type and revision.
+
+        The first synchronization lists the project and fetches the resources concurrently. Then, the synchronizations
+        consume the resource events of the project from the last one processed, which is stored in the database with
+        the resources it changed: an interrupted synchronization resumes from there. The resources are fetched again
+        only for the events of a revision more recent than the mirrored one.
+
+        Usage:
+            with ProjectMirror(nexus.resources, org_label, project_label, "project.db") as mirror:
+                mirror.sync()
+                for payload in mirror.find(type="Person"):
+                    ...
+    """
+
+    def __init__(self, resources: Resources, org_label: str, project_label: str, database: str, workers: int = 8,
+                 page_size: int = 100):
+        """
+            :param resources: the Resources used to list and fetch the resources
+            :param org_label: The label of the organization of the project
+            :param project_label: The label of the project
+            :param database: path of the SQLite database, created if it does not exist
+            :param workers: OPTIONAL number of resources fetched at the same time (default: 8)
+            :param page_size: OPTIONAL number of resources listed per page and of events applied per transaction
+                (default: 100)
+        """
+        resources._http.require_sync("ProjectMirror")
+        self._resources = resources
+        self.org_label = org_label
+        self.project_label = project_label
+        self.workers = workers
+        self.page_size = page_size
+        self._db = sqlite3.connect(database)
+        self._db.executescript(_schema)
+        project = self._checkpoint("project")
+        if project is None:
+            with self._db:
+                self._set_checkpoint("project", org_label + "/" + project_label)
+        elif project != org_label + "/" + project_label:
+            self._db.close()
+            raise ValueError("The database %s is the mirror of the project %s." % (database, project))
+
+    @property
+    def last_id(self) -> Optional[str]:
+        """
+            ID of the last event applied to the mirror, None if none was.
+        """
+        return self._checkpoint("last_id")
+
+    def sync(self, idle_timeout: float = 10.0) -> Dict[str, int]:
+        """
+            Takes the snapshot of the project if it was not completed yet, then applies the events of the project until
+            none is received for idle_timeout seconds. The first time, the events are consumed from the first one of
+            the project but the resources are only fetched for the events more recent than the snapshot.
+
+            :param idle_timeout: OPTIONAL number of seconds without any event after which the synchronization stops
+                (default: 10)
+            :return: the number of resources fetched, deleted and of events received
+        """
+        stats = {"fetched": 0, "deleted": 0, "events": 0}
+        if self._checkpoint("snapshot") is None:
+            self._snapshot(stats)
+        self._follow(idle_timeout, stats)
+        return stats
+
+    def get(self, resource_id: str) -> Optional[Dict]:
+        """
+            :param resource_id: expanded id of the resource
+            :return: the mirrored payload of the resource, or None
+        """
+        row = self._db.execute("SELECT payload FROM resources WHERE id = ?", (resource_id,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def find(self, type: Optional[str] = None, deprecated: Optional[bool] = None) -> Iterator[Dict]:
+        """
+            :param type: OPTIONAL only the resources with this type, as given in their payloads (default: None)
+            :param deprecated: OPTIONAL only the deprecated resources if True, the other ones if False (default: None)
+            :return: iterator of the mirrored payloads
+        """
+        query = "SELECT payload FROM resources"
+        conditions = []
+        args = []
+        if type is not None:
+            conditions.append("id IN (SELECT id FROM types WHERE type = ?)")
+            args.append(type)
+        if deprecated is not None:
+            conditions.append("deprecated = ?")
+            args.append(int(deprecated))
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        for row in self._db.execute(query, args):
+            yield json.loads(row[0])
+
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _snapshot(self, stats: Dict[str, int]) -> None:
+        # an interrupted snapshot is listed again, but only the resources which changed since are fetched
+        listed = (r for r in self._resources.iter_list(self.org_label, self.project_label,
+                                                       pagination_size=self.page_size, max_pages=2)
+                  if r["_rev"] > self._rev(r["@id"]))
+        batch = []
+        for _, outcome in parallel_map(self._fetch, (r["@id"] for r in listed), workers=self.workers):
+            batch.append(self._outcome(outcome))
+            if len(batch) >= self.page_size:
+                self._apply(batch, stats)
+                batch = []
+        self._apply(batch, stats, snapshot="done")
+
+    def _follow(self, idle_timeout: float, stats: Dict[str, int]) -> None:
+        events = self._resources.project_events(self.org_label, self.project_label, self.last_id)
+        received = queue.Queue(maxsize=self.page_size * 10)
+        stop = threading.Event()
+        end = object()
+
+        def consume():
+            # the events client reconnects whenever its connection ends: it is read from a thread so that the
+            # synchronization can stop when it stays idle
+            try:
+                for event in events:
+                    if stop.is_set():
+                        return
+                    received.put(event)
+            except Exception as e:
+                received.put(e)
+            finally:
+                received.put(end)
+
+        threading.Thread(target=consume, name="nexussdk-mirror", daemon=True).start()
+        try:
+            while True:
+                try:
+                    batch = [received.get(timeout=idle_timeout)]
+                except queue.Empty:
+                    return
+                while len(batch) < self.page_size and not received.empty():
+                    batch.append(received.get())
+                # the events received before the end of the stream are applied
+                completion = next((i for i, item in enumerate(batch) if item is end or isinstance(item, Exception)),
+                                  None)
+                self._apply_events(batch[:completion], stats)
+                if completion is not None:
+                    if batch[completion] is end:
+                        return
+                    raise batch[completion]
+        finally:
+            stop.set()
+            # ends the thread and releases the connection, even if no event comes anymore
+            events.close()
+            # unblocks the thread if it is waiting for room in the queue
+            while not received.empty():
+                received.get_nowait()
+
+    def _apply_events(self, events: List, stats: Dict[str, int]) -> None:
+        if not events:
+            return
+        stats["events"] += len(events)
+        # the most recent revision of each resource of the batch, to fetch it once
+        revisions = {}
+        for event in events:
+            try:
+                data = json.loads(event.data) if event.data else {}
+            except ValueError:
+                continue
+            resource_id = data.get("_resourceId") if isinstance(data, dict) else None
+            if resource_id:
+                revisions[resource_id] = max(revisions.get(resource_id, 0), data.get("_rev") or float("inf"))
+        changed = [i for i, rev in revisions.items() if rev > self._rev(i)]
+        outcomes = [self._outcome(o) for _, o in parallel_map(self._fetch, changed, workers=self.workers)]
+        last_id = next((e.id for e in reversed(events) if e.id), None)
+        self._apply(outcomes, stats, last_id=last_id)
+
+    def _fetch(self, resource_id: str):
+        try:
+            return resource_id, self._resources.fetch(self.org_label, self.project_label, resource_id)
+        except HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return resource_id, None
+            raise
+
+    @staticmethod
+    def _outcome(outcome):
+        # parallel_map gives the exception instead of the result of a failed fetch
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def _apply(self, outcomes: Iterable, stats: Dict[str, int], **checkpoint: Optional[str]) -> None:
+        # the resources and the checkpoint are written in the same transaction, so that they stay consistent
+        with self._db:
+            for resource_id, payload in outcomes:
+                if payload is None:
+                    deleted = self._db.execute("DELETE FROM resources WHERE id = ?", (resource_id,)).rowcount
+                    self._db.execute("DELETE FROM types WHERE id = ?", (resource_id,))
+                    stats["deleted"] += deleted
+                    continue
+                if payload.get("_rev", 0) <= self._rev(resource_id):
+                    continue
+                self._db.execute("INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?)",
+                                 (resource_id, payload.get("_rev", 0), int(bool(payload.get("_deprecated"))),
+                                  json.dumps(payload)))
+                types = payload.get("@type") or []
+                self._db.execute("DELETE FROM types WHERE id = ?", (resource_id,))
+                self._db.executemany("INSERT OR IGNORE INTO types VALUES (?, ?)",
+                                     [(resource_id, t) for t in ([types] if isinstance(types, str) else types)])
+                stats["fetched"] += 1
+            for key, value in checkpoint.items():
+                if value is not None:
+                    self._set_checkpoint(key, value)
+
+    def _rev(self, resource_id: str) -> int:
+        row = self._db.execute("SELECT rev FROM resources WHERE id = ?", (resource_id,)).fetchone()
+        return row[0] if row is not None else 0
+
+    def _checkpoint(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM checkpoint WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def _set_checkpoint(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO checkpoint VALUES (?, ?)", (key, value))
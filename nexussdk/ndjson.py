@@ -0,0 +1,328 @@
+"""
+Transfer of the resources of a project from and to NDJSON files (one JSON payload per line), in constant memory whatever
+the size of the project, with checkpoints to resume an interrupted transfer.
+"""
+
+import collections
+import gzip
+import json
+import os
+import threading
+from typing import Dict, Iterator, Optional, Tuple
+
+from requests.exceptions import HTTPError
+
+from nexussdk.resources import Resources
+from nexussdk.utils.pagination import iter_results_resumable
+from nexussdk.utils.parallel import parallel_map
+
+
+def export_resources(resources: Resources, org_label: str, project_label: str, filepath: str, shards: int = 1,
+                     workers: int = 8, page_size: int = 100, checkpoint_every: int = 1000, resume: bool = False,
+                     **filters) -> int:
+    """
+        Export the resources of a project to NDJSON: the resources are listed, their payloads are fetched concurrently
+        and written one per line, in the order of the listing. The files are gzip-compressed if filepath ends with
+        ".gz".
+
+        Every checkpoint_every resources, the files are flushed and the position in the listing (its page, as a `_next`
+        link or a from index, and the number of resources of the page already exported) is saved in
+        filepath + ".checkpoint", which is removed once the export is completed. With resume=True, an export resumes
+        from there: the lines written after the checkpoint are discarded and the listing continues from the saved
+        position. The listing must not change in between, apart from the resources created after it.
+
+        :param resources: the Resources used to list and fetch the resources
+        :param org_label: The label of the organization of the project
+        :param project_label: The label of the project
+        :param filepath: path of the file to write. If shards is greater than 1, it must contain "{shard}", replaced
+            by the index of each file (e.g. "export-{shard}.ndjson.gz")
+        :param shards: OPTIONAL number of files the resources are distributed to, in turn (default: 1)
+        :param workers: OPTIONAL number of resources fetched at the same time (default: 8)
+        :param page_size: OPTIONAL number of resources listed per page (default: 100)
+        :param checkpoint_every: OPTIONAL number of resources between two checkpoints (default: 1000)
+        :param resume: OPTIONAL if True, resume the export from its checkpoint if there is one (default: False)
+        :param filters: OPTIONAL filters of the listing, see Resources.list (e.g. type, deprecated)
+        :return: the number of resources written, since the checkpoint when resuming
+    """
+    resources._http.require_sync("export_resources")
+    if shards > 1 and "{shard}" not in filepath:
+        raise ValueError("The filepath must contain {shard} to export to several files.")
+    filepaths = [filepath.format(shard=i) for i in range(shards)] if shards > 1 else [filepath]
+    checkpoint_filepath = filepath.replace("{shard}", "") + ".checkpoint"
+    checkpoint = _read_checkpoint(checkpoint_filepath) if resume else None
+    if checkpoint is not None and len(checkpoint["sizes"]) != shards:
+        raise ValueError("The export to resume was made to %d files." % len(checkpoint["sizes"]))
+    count = checkpoint["count"] if checkpoint is not None else 0
+    writers = [_ShardWriter(f, checkpoint["sizes"][i] if checkpoint is not None else None)
+               for i, f in enumerate(filepaths)]
+
+    def fetch(resource_id: str) -> Optional[Dict]:
+        try:
+            return resources.fetch(org_label, project_label, resource_id)
+        except HTTPError as e:
+            # deleted since it was listed
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def fetch_page(pagination_from: int, pagination_size: int) -> Dict:
+        return resources.list(org_label, project_label, pagination_from, pagination_size, **filters)
+
+    # the large listings are paginated with _next links, which a from index cannot resume
+    listed = iter_results_resumable(resources._http, fetch_page, checkpoint["cursor"] if checkpoint else None,
+                                    page_size, max_pages=2)
+    written = 0
+    try:
+        for _, outcome in parallel_map(lambda item: (fetch(item[0]["@id"]), item[1]), listed, workers=workers):
+            if isinstance(outcome, Exception):
+                raise outcome
+            payload, cursor = outcome
+            if payload is not None:
+                writers[count % shards].write(json.dumps(payload).encode("utf-8") + b"\n")
+                written += 1
+            count += 1
+            if count % checkpoint_every == 0:
+                sizes = [w.checkpoint() for w in writers]
+                _write_checkpoint(checkpoint_filepath, {"count": count, "cursor": cursor, "sizes": sizes})
+    finally:
+        for writer in writers:
+            writer.close()
+    if os.path.exists(checkpoint_filepath):
+        os.remove(checkpoint_filepath)
+    return written
+
+
+def import_resources(resources: Resources, org_label: str, project_label: str, filepath: str,
+                     schema_id: Optional[str] = None, workers: int = 8, checkpoint_every: int = 1000,
+                     resume: bool = False) -> Dict[str, int]:
+    """
+        Import NDJSON resources (one payload per line, e.g. written by export_resources) into a project. The lines are
+        read lazily and sent concurrently. The file is read as gzip if filepath ends with ".gz".
+
+        The metadata of the payloads (the keys starting with "_") are removed. A payload with an @id is created with
+        this id, or updated if a resource already has it and its content differs (@context aside). A payload without
+        @id is created with an id generated by Nexus.
+
+        The lines which are rejected (invalid JSON, 4xx responses) are written to filepath + ".errors", with their
+        offset and the error, and the import continues. On another error, it stops. Every checkpoint_every lines, and
+        when it stops, the offset up to which all the lines are processed is saved in filepath + ".checkpoint". The
+        offsets of the lines processed since are appended to filepath + ".done" as soon as they are, so that the lines
+        processed out of order or after the last checkpoint are known too. With resume=True, an import resumes from
+        there and does not send again the lines already processed, even after a crash. Only a line whose resource was
+        sent but not yet recorded as processed when the import crashed can be sent again. Both files are removed once
+        the import is completed.
+
+        :param resources: the Resources used to create and update the resources
+        :param org_label: The label of the organization of the project
+        :param project_label: The label of the project
+        :param filepath: path of the file to read
+        :param schema_id: OPTIONAL The schema to constrain the data. Can be None for non constrained data
+        :param workers: OPTIONAL number of resources sent at the same time (default: 8)
+        :param checkpoint_every: OPTIONAL number of lines between two checkpoints, which compact the record of the
+            processed lines (default: 1000)
+        :param resume: OPTIONAL if True, resume the import from its checkpoint if there is one (default: False)
+        :return: the number of resources created, updated, unchanged (already imported) and rejected
+    """
+    resources._http.require_sync("import_resources")
+    checkpoint_filepath = filepath + ".checkpoint"
+    checkpoint = _read_checkpoint(checkpoint_filepath) if resume else None
+    offset = checkpoint["offset"] if checkpoint is not None else 0
+    counts = dict.fromkeys(("created", "updated", "unchanged", "rejected"), 0)
+    done = _ProcessedLines(filepath + ".done", offset, resume)
+
+    def send(line: Tuple[int, bytes]) -> str:
+        start, content = line
+        outcome = write(content)
+        done.add(start)
+        return outcome
+
+    def write(content: bytes) -> str:
+        payload = json.loads(content)
+        if not isinstance(payload, dict):
+            raise ValueError("The line is not a JSON object.")
+        data = {k: v for k, v in payload.items() if not k.startswith("_")}
+        resource_id = data.get("@id")
+        if resource_id is None:
+            resources.create(org_label, project_label, data, schema_id=schema_id)
+            return "created"
+        try:
+            resources.create(org_label, project_label, data, schema_id=schema_id, resource_id=resource_id)
+            return "created"
+        except HTTPError as e:
+            if e.response is None or e.response.status_code != 409:
+                raise
+        # already created, e.g. by an interrupted import
+        current = resources.fetch(org_label, project_label, resource_id)
+        if _content(current) == _content(data):
+            return "unchanged"
+        resources.update({**data, "_self": current["_self"]}, rev=current["_rev"])
+        return "updated"
+
+    opener = gzip.open if filepath.endswith(".gz") else open
+    with opener(filepath, "rb") as f, open(filepath + ".errors", "ab" if resume else "wb") as errors:
+        f.seek(offset)
+        # positions of the lines being sent, in the order of the outcomes
+        positions = collections.deque()
+
+        def lines() -> Iterator[Tuple[int, bytes]]:
+            for start, end, content in _lines(f):
+                if start in done:
+                    continue
+                positions.append((start, end))
+                yield start, content
+
+        processed = 0
+        for _, outcome in parallel_map(send, lines(), workers=workers):
+            start, end = positions.popleft()
+            if isinstance(outcome, Exception) and not _rejected(outcome):
+                # e.g. the server is unavailable: stopped to be resumed from this line
+                errors.flush()
+                _write_checkpoint(checkpoint_filepath, {"offset": start})
+                done.compact(start)
+                raise outcome
+            if isinstance(outcome, Exception):
+                counts["rejected"] += 1
+                error = {"offset": start, "error": "%s: %s" % (type(outcome).__name__, outcome)}
+                if isinstance(outcome, HTTPError) and outcome.response is not None:
+                    error["response"] = outcome.response.text
+                errors.write(json.dumps(error).encode("utf-8") + b"\n")
+                errors.flush()
+                done.add(start)
+            else:
+                counts[outcome] += 1
+            processed += 1
+            if processed % checkpoint_every == 0:
+                # the lines processed out of order after this offset stay in the record
+                _write_checkpoint(checkpoint_filepath, {"offset": end})
+                done.compact(end)
+    done.remove()
+    if os.path.exists(checkpoint_filepath):
+        os.remove(checkpoint_filepath)
+    return counts
+
+
+def _rejected(error: Exception) -> bool:
+    # the payload is invalid, sending it again would fail again
+    if isinstance(error, ValueError):
+        return True
+    return isinstance(error, HTTPError) and error.response is not None and 400 <= error.response.status_code < 500
+
+
+def _content(payload: Dict) -> Dict:
+    # what an import can change: the ids and contexts can be compacted or completed by Nexus
+    return {k: v for k, v in payload.items() if not k.startswith("_") and k not in ("@id", "@context")}
+
+
+def _lines(f) -> Iterator[Tuple[int, int, bytes]]:
+    # lines with the offsets of their start and end in the file, the blank ones are skipped
+    while True:
+        start = f.tell()
+        line = f.readline()
+        if not line:
+            return
+        if line.strip():
+            yield start, start + len(line), line
+
+
+class _ProcessedLines:
+    """
+        Append-only record of the offsets of the lines processed after the checkpoint of an import, flushed at each
+        line so that it survives a crash of the process. It is compacted at each checkpoint.
+    """
+
+    def __init__(self, filepath: str, offset: int, resume: bool):
+        self.filepath = filepath
+        self._lock = threading.Lock()
+        self._offsets = set()
+        if resume and os.path.exists(filepath):
+            with open(filepath) as f:
+                # the last line can be incomplete after a crash
+                self._offsets = {int(line) for line in f if line.endswith("\n") and int(line) >= offset}
+        self._file = None
+        self.compact(offset)
+
+    def __contains__(self, offset: int) -> bool:
+        return offset in self._offsets
+
+    def add(self, offset: int) -> None:
+        with self._lock:
+            self._offsets.add(offset)
+            self._file.write("%d\n" % offset)
+            self._file.flush()
+
+    def compact(self, offset: int) -> None:
+        """
+            Forgets the lines before the offset of the checkpoint.
+        """
+        with self._lock:
+            self._offsets = {o for o in self._offsets if o >= offset}
+            if self._file is not None:
+                self._file.close()
+            # replaced atomically, so that an interruption leaves the previous record
+            with open(self.filepath + ".tmp", "w") as f:
+                f.writelines("%d\n" % o for o in sorted(self._offsets))
+            os.replace(self.filepath + ".tmp", self.filepath)
+            self._file = open(self.filepath, "a")
+
+    def remove(self) -> None:
+        with self._lock:
+            self._file.close()
+            os.remove(self.filepath)
+
+
+class _ShardWriter:
+    """
+        Output file of an export. With gzip, a member is completed at each checkpoint, so that the file can be truncated
+        at the size of the last checkpoint and appended to.
+    """
+
+    def __init__(self, filepath: str, size: Optional[int]):
+        if size is None:
+            self._file = open(filepath, "wb")
+        else:
+            self._file = open(filepath, "r+b")
+            self._file.truncate(size)
+            self._file.seek(size)
+        self._compress = filepath.endswith(".gz")
+        self._member = None
+
+    def write(self, line: bytes) -> None:
+        if not self._compress:
+            self._file.write(line)
+            return
+        if self._member is None:
+            self._member = gzip.GzipFile(fileobj=self._file, mode="wb")
+        self._member.write(line)
+
+    def checkpoint(self) -> int:
+        """
+            :return: the size of the file, once everything written is stored
+        """
+        if self._member is not None:
+            self._member.close()
+            self._member = None
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def close(self) -> None:
+        if self._member is not None:
+            self._member.close()
+        self._file.close()
+
+
+def _read_checkpoint(filepath: str) -> Optional[Dict]:
+    try:
+        with open(filepath) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write_checkpoint(filepath: str, checkpoint: Dict) -> None:
+    # replaced atomically, so that an interruption leaves the previous checkpoint
+    with open(filepath + ".tmp", "w") as f:
+        json.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(filepath + ".tmp", filepath)
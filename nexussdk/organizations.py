@@ -6,6 +6,7 @@ from typing import Optional
 from urllib.parse import quote_plus as url_encode
 
 from nexussdk.utils.http import Http
+from nexussdk.utils.pagination import iter_results
 
 
 class Organizations:
@@ -80,6 +81,18 @@ class Organizations:
 
         return self._http.get(path, use_base=True)
 
+    def iter_list(self, pagination_from=0, pagination_size=20, max_pages=1):
+        """
+        Iterate over the organizations, fetching the pages lazily.
+
+        :param pagination_from: OPTIONAL Index of the list to start from (default: 0)
+        :param pagination_size: OPTIONAL The number of organizations fetched per page (default: 20)
+        :param max_pages: OPTIONAL maximum number of pages held in memory. If greater than 1, the next pages are
+            fetched in the background while the current one is consumed (default: 1)
+        :return: iterator of the listed organizations
+        """
+        return iter_results(self._http, self.list, pagination_from, pagination_size, max_pages)
+
     def deprecate(self, org_label, rev):
         """
         Deprecate an organization. Nexus does not allow deleting organizations so deprecating is the way to flag them as
@@ -6,6 +6,7 @@ from typing import Optional
 from urllib.parse import quote_plus as url_encode
 
 from nexussdk.utils.http import Http
+from nexussdk.utils.pagination import iter_results
 
 
 class Projects:
@@ -121,6 +122,23 @@ class Projects:
 
         return self._http.get(path, use_base=True)
 
+    def iter_list(self, org_label=None, pagination_from=0, pagination_size=20, deprecated=None,
+                  full_text_search_query=None, max_pages=1):
+        """
+        Iterate over the projects, fetching the pages lazily. See `list` for the filtering arguments.
+
+        :param pagination_from: OPTIONAL Index of the list to start from (default: 0)
+        :param pagination_size: OPTIONAL The number of projects fetched per page (default: 20)
+        :param max_pages: OPTIONAL maximum number of pages held in memory. If greater than 1, the next pages are
+            fetched in the background while the current one is consumed (default: 1)
+        :return: iterator of the listed projects
+        """
+
+        def fetch_page(page_from, page_size):
+            return self.list(org_label, page_from, page_size, deprecated, full_text_search_query)
+
+        return iter_results(self._http, fetch_page, pagination_from, pagination_size, max_pages)
+
     def deprecate_2(self, org_label, project_label, rev):
         """
         Deprecate a project. Nexus does not allow deleting projects so deprecating is the way to flag them as
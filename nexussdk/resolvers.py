@@ -4,10 +4,11 @@ It is part of the Knowledge Graph API of Blue Brain Nexus v1.
 https://bluebrainnexus.io/docs/api/1.1/kg/kg-resolvers-api.html
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 from urllib.parse import quote_plus as encode_url
 
 from nexussdk.utils.http import Http
+from nexussdk.utils.pagination import iter_results
 
 
 class Resolvers:
@@ -129,6 +130,30 @@ class Resolvers:
         params = self._params(pagination_from, pagination_size, deprecated, type, created_by, updated_by, rev)
         return self._http.get(path, params=params)
 
+    def iter_list(self, org_label: str, project_label: str, pagination_from: int = None,
+                  pagination_size: int = None, deprecated: bool = None, type: str = None,
+                  created_by: str = None, updated_by: str = None, rev: int = None,
+                  max_pages: int = 1) -> Iterator[Dict]:
+        """Iterate over resolvers corresponding to some criteria, fetching the pages lazily.
+
+        See ``list`` for the filtering arguments.
+
+        :param pagination_from: (optional) Pagination index to start from.
+            Default: ``0``.
+        :param pagination_size: (optional) Number of resolvers fetched per page.
+            Default: ``20``.
+        :param max_pages: (optional) Maximum number of pages held in memory. If greater
+            than 1, the next pages are fetched in the background while the current
+            one is consumed. Default: ``1``.
+        :return: An iterator of the Nexus metadata of the matching resolvers.
+        """
+
+        def fetch_page(page_from, page_size):
+            return self.list(org_label, project_label, page_from, page_size, deprecated, type, created_by,
+                             updated_by, rev)
+
+        return iter_results(self._http, fetch_page, pagination_from, pagination_size, max_pages)
+
     # Update functions.
 
     def update(self, org_label: str, project_label: str, id: str, projects: List[str],
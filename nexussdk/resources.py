@@ -4,15 +4,26 @@ strings, arrays, boolean and complex objects made of those primitive types. In a
 Resources belong to projects and their access rights are defined at the project level.
 """
 
-from urllib.parse import quote_plus as url_encode
-from typing import Optional
+import threading
+from urllib.parse import quote_plus as url_encode, unquote_plus as url_decode
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
 from nexussdk.utils.http import Http
+from nexussdk.utils.pagination import iter_results
+from nexussdk.utils.parallel import parallel_map
+from nexussdk.utils.resource_cache import ResourceCache
 
 
 class Resources:
-    def __init__(self, http: Http):
+    def __init__(self, http: Http, cache: Optional[ResourceCache] = None):
+        """
+            :param http: the Http instance used to send the requests
+            :param cache: OPTIONAL in-memory cache of the fetched resources, see watch (default: None, no cache)
+        """
         self._http = http
+        self.cache = cache
+        # organization and project labels of the events watched, None for all of them
+        self._watched = (None, None)
 
     def fetch(self, org_label, project_label, resource_id, schema_id="_", rev=None, tag=None):
         """
@@ -26,17 +37,17 @@ class Resources:
             :param rev: OPTIONAL fetches a specific revision of a resource (default: None, fetches the last)
             :param tag: OPTIONAL fetches the resource version that has a specific tag (default: None)
             :return: Payload of the whole resource as a dictionary
+
+            When the Resources instance has a cache, the fetches of a revision or a tag are served from it once cached,
+            and the fetches of the latest revision too while the cache watches their events (see watch).
         """
 
         if rev is not None and tag is not None:
             raise Exception("The arguments rev and tag are mutually exclusive. One or the other must be chosen.")
 
         # the element composing the query URL need to be URL-encoded
-        org_label = url_encode(org_label)
-        project_label = url_encode(project_label)
-        schema_id = url_encode(schema_id)
-        resource_id = url_encode(resource_id)
-        path = "/resources/" + org_label + "/" + project_label + "/" + schema_id + "/" + resource_id
+        path = "/resources/" + url_encode(org_label) + "/" + url_encode(project_label) + "/" + url_encode(schema_id) \
+               + "/" + url_encode(resource_id)
 
         if rev is not None:
             path = path + "?rev=" + str(rev)
@@ -44,7 +55,19 @@ class Resources:
         if tag is not None:
             path = path + "?tag=" + str(tag)
 
-        return self._http.get(path, use_base=True)
+        if self.cache is None:
+            return self._http.get(path, use_base=True)
+
+        immutable = rev is not None or (tag is not None and self.cache.immutable_tags)
+        if not immutable and not (self.cache.watching and self._watched[0] in (None, org_label)
+                                  and self._watched[1] in (None, project_label)):
+            return self._http.get(path, use_base=True)
+        payload = self.cache.get(path)
+        if payload is None:
+            epoch = self.cache.epoch
+            payload = self._http.get(path, use_base=True)
+            self.cache.put(path, payload, _resource_ids(payload, resource_id), immutable, epoch)
+        return payload
 
     def update(self, resource, rev=None):
         """
@@ -64,7 +87,9 @@ class Resources:
 
         path = resource["_self"] + "?rev=" + str(rev)
 
-        return self._http.put(path, resource, use_base=False)
+        result = self._http.put(path, resource, use_base=False)
+        self._invalidate(resource)
+        return result
 
     def create(self, org_label, project_label, data, schema_id=None, resource_id=None):
         """
@@ -100,6 +125,33 @@ class Resources:
             path = path + "/" + resource_id
             return self._http.put(path, data, use_base=True)
 
+    def create_many(self, org_label: str, project_label: str, payloads: Iterable[Dict],
+                    schema_id: Optional[str] = None, workers: int = 4,
+                    ordered: bool = True) -> Iterator[Tuple[int, Any]]:
+        """
+            Create many resources concurrently. The payloads are consumed lazily, so they can come from a generator,
+            and only a bounded number of them is in flight at any time.
+            The requests go through the connection pool of the client, which should hold at least `workers`
+            connections per host (see the pool_maxsize option of NexusClient).
+
+            :param org_label: The label of the organization that the resources belong to
+            :param project_label: The label of the project that the resources belong to
+            :param payloads: iterable of dictionaries containing the data to store in the new resources
+            :param schema_id: OPTIONAL The schema to constrain the data. Can be None for non constrained data
+            :param workers: OPTIONAL number of resources created at the same time (default: 4)
+            :param ordered: OPTIONAL if True, the results are yielded in input order, if False in completion order
+                (default: True)
+            :return: iterator of (index, result) tuples where index is the position of the payload in the input and
+                result is either the Nexus metadata of the created resource or the exception raised while creating it
+        """
+
+        self._http.require_sync("Resources.create_many")
+
+        def create(data):
+            return self.create(org_label, project_label, data, schema_id=schema_id)
+
+        return parallel_map(create, payloads, workers=workers, ordered=ordered)
+
     def list(self, org_label, project_label, pagination_from=0, pagination_size=20,
              deprecated=None, type=None, rev=None, schema=None, created_by=None, updated_by=None, resource_id=None):
         """
@@ -143,6 +195,25 @@ class Resources:
 
         return self._http.get(path, use_base=True, params=params)
 
+    def iter_list(self, org_label, project_label, pagination_from=0, pagination_size=20, deprecated=None, type=None,
+                  rev=None, schema=None, created_by=None, updated_by=None, resource_id=None, max_pages=1):
+        """
+        Iterate over the resources available for a given organization and project, fetching the pages lazily.
+        See `list` for the filtering arguments.
+
+        :param pagination_from: OPTIONAL The pagination index to start from (default: 0)
+        :param pagination_size: OPTIONAL The number of resources fetched per page (default: 20)
+        :param max_pages: OPTIONAL maximum number of pages held in memory. If greater than 1, the next pages are
+            fetched in the background while the current one is consumed (default: 1)
+        :return: iterator of the listed resources
+        """
+
+        def fetch_page(page_from, page_size):
+            return self.list(org_label, project_label, page_from, page_size, deprecated, type, rev, schema,
+                             created_by, updated_by, resource_id)
+
+        return iter_results(self._http, fetch_page, pagination_from, pagination_size, max_pages)
+
     def deprecate(self, resource, rev=None):
         """
         Flag a resource as deprecated. Resources cannot be deleted in Nexus, once one is deprecated, it is no longer
@@ -159,7 +230,9 @@ class Resources:
 
         path = resource["_self"] + "?rev=" + str(rev)
 
-        return self._http.delete(path, use_base=False)
+        result = self._http.delete(path, use_base=False)
+        self._invalidate(resource)
+        return result
 
     def tag(self, resource, tag_value, rev_to_tag=None, rev=None):
         """
@@ -187,7 +260,9 @@ class Resources:
             "rev": rev_to_tag
         }
 
-        return self._http.post(path, body=data, use_base=False)
+        result = self._http.post(path, body=data, use_base=False)
+        self._invalidate(resource)
+        return result
 
     def tags(self, resource):
         """
@@ -232,3 +307,46 @@ class Resources:
         :return: iterator of resource events for the given organization
         """
         return self._http.sse_request("/resources/" + org_label + "/events", last_id)
+
+    def watch(self, org_label: Optional[str] = None, project_label: Optional[str] = None,
+              last_id: Optional[str] = None) -> threading.Thread:
+        """
+        Start consuming the resource events in a background thread to invalidate the cache of the fetched resources,
+        which then also caches the latest revisions. The events of a project are consumed if project_label is given,
+        of an organization if only org_label is given, of all the resources otherwise. Only the latest revisions of the
+        resources in this scope are cached, once the past events have been consumed (see ResourceCache). Stop watching
+        with cache.stop().
+
+        :param org_label: OPTIONAL organization label
+        :param project_label: OPTIONAL project label
+        :param last_id: OPTIONAL ID of the last event which is already reflected by the server, to avoid consuming the
+            whole history of the events before caching the latest revisions (default: None, from the first event)
+        :return: the thread consuming the events
+        """
+        if self.cache is None:
+            raise ValueError("The resources have no cache to invalidate, see the resource_cache option of NexusClient.")
+        if project_label is not None:
+            events = self.project_events(org_label, project_label, last_id)
+        elif org_label is not None:
+            events = self.org_events(org_label, last_id)
+        else:
+            events = self.events(last_id)
+        thread = self.cache.watch(events)
+        self._watched = (org_label, project_label)
+        return thread
+
+    def _invalidate(self, resource: Dict) -> None:
+        if self.cache is not None:
+            for resource_id in _resource_ids(resource):
+                self.cache.invalidate(resource_id)
+
+
+def _resource_ids(payload: Dict, resource_id: Optional[str] = None) -> Iterator[str]:
+    # the ids a resource can be known by: the one it was fetched with, its possibly compacted @id and its expanded id,
+    # which is the one of the events and the last segment of _self
+    if resource_id is not None:
+        yield resource_id
+    if payload.get("@id"):
+        yield payload["@id"]
+    if payload.get("_self"):
+        yield url_decode(payload["_self"].rsplit("/", 1)[-1])
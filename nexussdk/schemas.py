@@ -6,6 +6,7 @@ import json
 from urllib.parse import quote_plus as url_encode
 
 from nexussdk.utils.http import Http
+from nexussdk.utils.pagination import iter_results
 
 
 class Schemas:
@@ -45,6 +46,23 @@ class Schemas:
 
         return self._http.get(path, use_base=True)
 
+    def iter_list(self, org_label, project_label, pagination_from=0, pagination_size=20,
+                  deprecated=None, full_text_search_query=None, max_pages=1):
+        """
+        Iterate over the schemas available, fetching the pages lazily. See `list` for the filtering arguments.
+
+        :param pagination_from: OPTIONAL The pagination index to start from (default: 0)
+        :param pagination_size: OPTIONAL The number of schemas fetched per page (default: 20)
+        :param max_pages: OPTIONAL maximum number of pages held in memory. If greater than 1, the next pages are
+            fetched in the background while the current one is consumed (default: 1)
+        :return: iterator of the listed schemas
+        """
+
+        def fetch_page(page_from, page_size):
+            return self.list(org_label, project_label, page_from, page_size, deprecated, full_text_search_query)
+
+        return iter_results(self._http, fetch_page, pagination_from, pagination_size, max_pages)
+
     def fetch(self, org_label, project_label, schema_id, rev=None, tag=None):
         """
         Fetches a distant schema and returns the payload as a dictionary.
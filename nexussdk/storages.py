@@ -4,11 +4,12 @@ It is part of the Knowledge Graph API of Blue Brain Nexus v1.
 https://bluebrainnexus.io/docs/api/1.1/kg/kg-storages-api.html
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 from urllib.parse import quote_plus as url_encode
 
 from nexussdk.utils.http import Http
+from nexussdk.utils.pagination import iter_results
 from nexussdk.utils.tools import listing_params
 
 
@@ -396,3 +397,27 @@ class Storages:
                               params=listing_params(pagination_from, pagination_size, deprecated, type, created_by,
                                                     updated_by,
                                                     rev))
+
+    def iter_list(self, org_label: str, project_label: str, pagination_from: Optional[int] = None,
+                  pagination_size: Optional[int] = None, deprecated: Optional[bool] = None,
+                  type: Optional[str] = None, created_by: Optional[str] = None, updated_by: Optional[str] = None,
+                  rev: Optional[int] = None, max_pages: int = 1) -> Iterator[Dict]:
+        """Iterate over storages corresponding to some criteria, fetching the pages lazily.
+
+        See ``list`` for the filtering arguments.
+
+        :param pagination_from: (optional) Pagination index to start from.
+            Default: ``0``.
+        :param pagination_size: (optional) Number of storages fetched per page.
+            Default: ``20``.
+        :param max_pages: (optional) Maximum number of pages held in memory. If greater
+            than 1, the next pages are fetched in the background while the current
+            one is consumed. Default: ``1``.
+        :return: An iterator of the Nexus metadata of the matching storages.
+        """
+
+        def fetch_page(page_from, page_size):
+            return self.list(org_label, project_label, page_from, page_size, deprecated, type, created_by,
+                             updated_by, rev)
+
+        return iter_results(self._http, fetch_page, pagination_from, pagination_size, max_pages)
@@ -0,0 +1,346 @@
+import asyncio
+import contextlib
+import io
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from requests.exceptions import HTTPError
+
+from nexussdk.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from nexussdk.utils.http import Http
+from nexussdk.utils.instrumentation import RequestEvent
+from nexussdk.utils.multipart import MultipartFile
+from nexussdk.utils.rate_limit import RateLimiter
+from nexussdk.utils.response_cache import ResponseCache
+from nexussdk.utils.retry import RetryPolicy
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncHttp(Http):
+    """
+        Asynchronous counterpart of Http. The path building, headers and body preparation are inherited from Http,
+        only the transport is replaced by an aiohttp session. The verbs are coroutines, so every sub-API method that
+        returns the result of a verb directly becomes awaitable.
+
+        Events (sse_request) are still served by the synchronous transport of Http. The helpers which use the results
+        of the verbs directly (e.g. iter_list, Resources.create_many) raise a TypeError, see Http.require_sync.
+    """
+
+    asynchronous = True
+
+    def __init__(self, environment: str, token: Optional[str] = None, max_concurrency: int = 100,
+                 pool_maxsize: int = 100, timeout: Optional[Union[float, Tuple[float, float]]] = None,
+                 keep_alive: bool = True, json_decoder: Union[str, Callable[[bytes], Any]] = "standard",
+                 compression: Optional[str] = None, compression_threshold: int = 1024, compression_level: int = 6,
+                 retry: Union[int, RetryPolicy] = 3, rate_limiter: Optional[RateLimiter] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None, response_cache: Optional[ResponseCache] = None,
+                 coalesce_gets: bool = False):
+        """
+            :param environment: base URL of the Nexus deployment (e.g. https://nexus.example.org/v1)
+            :param token: OPTIONAL bearer token used to authenticate the requests
+            :param max_concurrency: OPTIONAL maximum number of requests in flight at the same time (default: 100)
+            :param pool_maxsize: OPTIONAL maximum number of connections kept alive per host (default: 100)
+            :param timeout: OPTIONAL socket timeout in seconds, either a single value or a (connect, read) tuple
+                (default: None, waits forever)
+            :param keep_alive: OPTIONAL if False, connections are closed after each request (default: True)
+            :param json_decoder: OPTIONAL how to decode the JSON responses, see Http (default: "standard")
+            :param compression: OPTIONAL "gzip" or "deflate" to compress the bodies of the requests, see Http
+                (default: None, not compressed)
+            :param compression_threshold: OPTIONAL minimum size in bytes of a body to compress it (default: 1024)
+            :param compression_level: OPTIONAL level of the compression, from 1 to 9 (default: 6)
+            :param retry: OPTIONAL policy to retry the requests which failed transiently, or the maximum number of
+                retries with the default RetryPolicy, 0 to disable the retries (default: 3)
+            :param rate_limiter: OPTIONAL limits of the rate of the requests and of the requests in flight, by endpoint
+                family, see Http (default: None, unlimited)
+            :param circuit_breaker: OPTIONAL circuit breaker making the requests to an endpoint family which keeps
+                failing fail immediately with a CircuitOpenError (default: None)
+            :param response_cache: OPTIONAL cache of the JSON responses of the GET requests, revalidated with
+                conditional requests (default: None)
+            :param coalesce_gets: OPTIONAL if True, identical GET requests for JSON sent while one of them is in flight
+                wait for its response instead of being sent (default: False)
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncHttp requires aiohttp. Install it with: pip install nexus-sdk[async]")
+        super().__init__(environment, token, timeout=timeout, keep_alive=keep_alive, json_decoder=json_decoder,
+                         compression=compression, compression_threshold=compression_threshold,
+                         compression_level=compression_level, retry=retry,
+                         rate_limiter=rate_limiter, circuit_breaker=circuit_breaker,
+                         response_cache=response_cache, coalesce_gets=coalesce_gets)
+        self.max_concurrency = max_concurrency
+        self.pool_maxsize = pool_maxsize
+        self._aio_session = None
+        self._semaphore = None
+
+    async def close(self):
+        """
+            Close the connections kept alive in the pool.
+        """
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+        super().close()
+
+    async def get(self, path: Union[str, List[str]], stream=False, get_raw_response=False, use_base=False,
+                  data_type=Http.default_type, accept="json", headers: Optional[Dict] = None, **kwargs):
+        """
+            Wrapper to perform a GET request. See Http.get for the arguments.
+
+            :return: if get_raw_response is True, returns the aiohttp response with its body not read yet,
+                the caller must release it. If get_raw_response is False, return the dictionary that is
+                equivalent to the json response
+        """
+        header = {**self._prepare_header(data_type, accept), **(headers or {})}
+        full_url = self._full_url(path, use_base)
+        params = kwargs.pop("params", None)
+        if not params:
+            params = kwargs
+        return await self._request("GET", full_url, headers=header, params=params, read_body=not get_raw_response,
+                                   decode=not get_raw_response)
+
+    async def post(self, path: Union[str, List[str]], body=None, data_type=Http.default_type, use_base=False,
+                   **kwargs):
+        """
+            Perform a POST request. See Http.post for the arguments.
+        """
+        return await self._send("POST", path, body, data_type, use_base, kwargs)
+
+    async def put(self, path: Union[str, List[str]], body=None, data_type=Http.default_type, use_base=False,
+                  **kwargs):
+        """
+            Performs a PUT request. See Http.put for the arguments.
+        """
+        return await self._send("PUT", path, body, data_type, use_base, kwargs)
+
+    async def patch(self, path: Union[str, List[str]], body=None, data_type=Http.default_type, use_base=False,
+                    **kwargs):
+        """
+            Performs a PATCH request. See Http.patch for the arguments.
+        """
+        return await self._send("PATCH", path, body, data_type, use_base, kwargs)
+
+    async def delete(self, path: Union[str, List[str]], body=None, data_type=Http.default_type, use_base=False,
+                     **kwargs):
+        """
+            Performs a DELETE request. See Http.delete for the arguments.
+        """
+        return await self._send("DELETE", path, body, data_type, use_base, kwargs)
+
+    # Internal helpers
+    async def _send(self, method: str, path: Union[str, List[str]], body, data_type: str, use_base: bool,
+                    params: dict):
+        full_url = self._full_url(path, use_base)
+        if data_type != "file":
+            header = self._prepare_header(type=data_type if method in ("POST", "PUT") else Http.default_type)
+            data = self._prepare_body(body, data_type)
+            if method != "DELETE":
+                data = self._compress_body(header, data)
+        elif isinstance(body, MultipartFile):
+            header = self._prepare_header(type=data_type)
+            header["Content-Type"] = body.content_type
+            header["Content-Length"] = str(len(body))
+            data = body
+        else:
+            header = self._prepare_header(type=data_type)
+            data = aiohttp.FormData()
+            for name, (filename, content, content_type) in body.items():
+                data.add_field(name, content, filename=filename, content_type=content_type)
+        return await self._request(method, full_url, decode=True, headers=header, params=params, data=data)
+
+    def _client_session(self):
+        # created lazily because aiohttp sessions must be created inside a running event loop
+        if self._aio_session is None or self._aio_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_maxsize, force_close=not self.keep_alive)
+            if isinstance(self.timeout, tuple):
+                timeout = aiohttp.ClientTimeout(sock_connect=self.timeout[0], sock_read=self.timeout[1])
+            else:
+                timeout = aiohttp.ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout)
+            self._aio_session = aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                                      trace_configs=[_timings_trace_config()])
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._aio_session
+
+    def _async_limit(self, family: str):
+        """
+            Asynchronous context manager waiting until the rate limiter, if any, allows to send a request to the
+            endpoint family.
+        """
+        if self.rate_limiter is None:
+            return _unlimited()
+        return self.rate_limiter.async_slot(family)
+
+    async def _request(self, method: str, url: str, params: Optional[dict] = None, read_body: bool = True,
+                       decode: bool = False, **kwargs):
+        """
+            Send a request through the pooled session, within the concurrency limit, retry it according to the retry
+            policy if it failed transiently, and raise an HTTPError if it failed, or a CircuitOpenError if its
+            endpoint keeps failing. When read_body is True, the body is read and the connection is released.
+
+            :param decode: OPTIONAL if True, return the decoded JSON response instead of the response (default: False)
+        """
+        if self._single_flight is not None and method == "GET" and decode:
+            key = self._flight_key(url, {**kwargs, "params": params})
+            return await self._single_flight.do_async(
+                key, lambda: self._execute(method, url, params, read_body, decode, **kwargs))
+        return await self._execute(method, url, params, read_body, decode, **kwargs)
+
+    async def _execute(self, method: str, url: str, params: Optional[dict], read_body: bool, decode: bool,
+                       **kwargs):
+        """
+            Body of _request, without the coalescing.
+        """
+        session = self._client_session()
+        # aiohttp refuses None and booleans as parameter values, requests drops the former and stringifies the latter
+        if params:
+            params = {k: str(v) for k, v in params.items() if v is not None}
+        cache_key, cached = self._cache_lookup(method, url, params, kwargs.get("headers", {}), decode)
+        if cached is not None and cached.immutable:
+            return self._decode_json(cached.content)
+        if cached is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **cached.validators()}
+        # a body read from a file (e.g. a MultipartFile) must be rewound to be sent again, a form can only be sent once
+        body = kwargs.get("data")
+        position = body.tell() if isinstance(body, io.IOBase) else None
+        retryable = not isinstance(body, aiohttp.FormData)
+        family = self._endpoint_family(url)
+        event = RequestEvent(method, self._path_template(url), family) if self._hooks else None
+        started = time.monotonic()
+        first_attempt_end = None
+        retries = 0
+        content = None
+        while True:
+            if retries and position is not None:
+                body.seek(position)
+            response, error = None, None
+            timings = {}
+            try:
+                probe = self.circuit_breaker.before(family) if self.circuit_breaker is not None else False
+            except CircuitOpenError as e:
+                # the request is not sent, it is counted and measured as a failure without a response
+                error = e
+                first_attempt_end = first_attempt_end or time.monotonic()
+                break
+            # the rate limiter is waited for first, so a throttled request does not take a concurrency slot
+            async with self._async_limit(family), self._semaphore:
+                try:
+                    response = await session.request(method, url, params=params, trace_request_ctx=timings,
+                                                     **kwargs)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = e
+                finally:
+                    if self.circuit_breaker is not None:
+                        status = response.status if response is not None else None
+                        self.circuit_breaker.after(family, self.circuit_breaker.is_failure(status), probe)
+                now = time.monotonic()
+                first_attempt_end = first_attempt_end or now
+                if not retryable:
+                    delay = None
+                elif response is not None:
+                    delay = self.retry.delay(method, retries, now - started, response.status,
+                                             response.headers.get("Retry-After"))
+                else:
+                    delay = self.retry.delay(method, retries, now - started,
+                                             sent=not isinstance(error, aiohttp.ClientConnectorError))
+                if delay is None:
+                    if response is not None and response.status >= 400:
+                        reason = await response.text()
+                        response.release()
+                    elif response is not None and read_body:
+                        # reading the whole body releases the connection, releasing it explicitly would forbid
+                        # reading it again
+                        content = await response.read()
+                    break
+                if response is not None:
+                    response.release()
+            await asyncio.sleep(delay)
+            retries += 1
+        failed = error is not None or response.status in self.retry.status_codes
+        self.retry.record(retries, time.monotonic() - first_attempt_end, not failed)
+        try:
+            if error is not None:
+                raise error
+            if response.status >= 400:
+                kind = "Client" if response.status < 500 else "Server"
+                raise HTTPError("%s %s Error: %s for url: %s" % (response.status, kind, reason, response.url),
+                                response=response)
+            if not decode:
+                return response
+            if cached is not None and response.status == 304:
+                content = cached.content
+            decode_started = time.monotonic()
+            result = self._decode_json(content)
+            if event is not None:
+                event.decode_seconds = time.monotonic() - decode_started
+            if cache_key is not None:
+                self._cache_store(cache_key, cached, url, params, response.status, response.headers, content, result)
+            return result
+        finally:
+            if event is not None:
+                event.retries = retries
+                event.total_seconds = time.monotonic() - started
+                self._measure_async(event, response, error, content, timings)
+                self._emit(event)
+
+    @staticmethod
+    def _measure_async(event: RequestEvent, response, error: Optional[Exception], content: Optional[bytes],
+                       timings: Dict) -> None:
+        """
+            Fill an event with the measures of the last attempt of its request, traced in timings.
+        """
+        event.dns_seconds = timings.get("dns")
+        event.connect_seconds = timings.get("connect")
+        if response is None:
+            event.error = type(error).__name__
+            return
+        event.status = response.status
+        event.bytes_sent = int(response.request_info.headers.get("Content-Length", 0))
+        if "Content-Length" in response.headers:
+            event.bytes_received = int(response.headers["Content-Length"])
+        elif content is not None:
+            event.bytes_received = len(content)
+        if "headers" in timings:
+            # the opening of the connection happens between the start of the request and the reception of the headers
+            event.ttfb_seconds = timings["headers"] - timings["start"] - (event.connect_seconds or 0.0)
+
+
+@contextlib.asynccontextmanager
+async def _unlimited():
+    yield
+
+
+def _timings_trace_config():
+    """
+        Trace configuration recording the timings of each request in the dictionary given as its trace_request_ctx.
+    """
+
+    def recorder(name: str, start: bool):
+        async def record(session, context, params):
+            timings = context.trace_request_ctx
+            if timings is None:
+                return
+            now = asyncio.get_running_loop().time()
+            if start:
+                timings["_" + name] = now
+            else:
+                timings[name] = now - timings.pop("_" + name, now)
+        return record
+
+    async def on_request_start(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["start"] = asyncio.get_running_loop().time()
+
+    async def on_request_end(session, context, params):
+        if context.trace_request_ctx is not None:
+            context.trace_request_ctx["headers"] = asyncio.get_running_loop().time()
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_dns_resolvehost_start.append(recorder("dns", True))
+    trace_config.on_dns_resolvehost_end.append(recorder("dns", False))
+    trace_config.on_connection_create_start.append(recorder("connect", True))
+    trace_config.on_connection_create_end.append(recorder("connect", False))
+    return trace_config
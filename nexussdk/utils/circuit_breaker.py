@@ -0,0 +1,144 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from requests.exceptions import RequestException
+
+
+class CircuitOpenError(RequestException):
+    """
+        Raised instead of sending a request to an endpoint family whose circuit is open.
+    """
+
+    def __init__(self, family: str, retry_in: float):
+        super().__init__("The circuit of the endpoint family '%s' is open after repeated failures, retry in %.1f s."
+                         % (family, retry_in))
+        self.family = family
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+        Circuit breaker by endpoint family, as computed by Http._endpoint_family (e.g. "resources", "views/_search").
+
+        The circuit of a family is closed while its requests succeed. After failure_threshold consecutive failures
+        (connection errors, timeouts or failure_status_codes), it opens: the requests of the family fail immediately
+        with a CircuitOpenError, without waiting for a timeout, while the requests of the other families go on. After
+        reset_timeout seconds, it is half-open: half_open_probes requests are let through as probes. If they succeed,
+        the circuit closes, otherwise it opens again for another reset_timeout.
+
+        The breaker is thread-safe and can be shared by several clients.
+
+        Usage:
+            nexus = NexusClient(environment, token, circuit_breaker=CircuitBreaker(failure_threshold=5))
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_probes: int = 1,
+                 failure_status_codes: Iterable[int] = (500, 502, 503, 504)):
+        """
+            :param failure_threshold: OPTIONAL number of consecutive failures opening the circuit (default: 5)
+            :param reset_timeout: OPTIONAL time in seconds during which an open circuit rejects the requests before
+                letting probes through (default: 30)
+            :param half_open_probes: OPTIONAL number of successful probes closing the circuit, which is also the
+                number of probes in flight at the same time (default: 1)
+            :param failure_status_codes: OPTIONAL status codes counted as failures (default: 500, 502, 503, 504)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.failure_status_codes = frozenset(failure_status_codes)
+        self._lock = threading.Lock()
+        self._circuits = {}
+
+    def before(self, family: str) -> bool:
+        """
+            Checks that a request of the family can be sent. Must be followed by a call to after once it is completed.
+
+            :param family: endpoint family of the request
+            :return: True if the request is a probe of a half-open circuit, False otherwise
+            :raises CircuitOpenError: if the circuit is open, or half-open with all its probes in flight
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None or circuit.state == "closed":
+                return False
+            now = time.monotonic()
+            if circuit.state == "open":
+                if now < circuit.opened_at + self.reset_timeout:
+                    raise CircuitOpenError(family, circuit.opened_at + self.reset_timeout - now)
+                circuit.state = "half-open"
+                circuit.successes = 0
+            if circuit.probes >= self.half_open_probes:
+                raise CircuitOpenError(family, 0.0)
+            circuit.probes += 1
+            return True
+
+    def after(self, family: str, failed: bool, probe: bool) -> None:
+        """
+            Records the outcome of a request.
+
+            :param family: endpoint family of the request
+            :param failed: True if the request failed because of the endpoint
+            :param probe: value returned by before for this request
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[family] = _Circuit()
+            if probe:
+                circuit.probes -= 1
+            if failed:
+                circuit.failures += 1
+                if circuit.state == "half-open" or circuit.failures >= self.failure_threshold:
+                    circuit.state = "open"
+                    circuit.opened_at = time.monotonic()
+                    circuit.opened += 1
+            else:
+                circuit.failures = 0
+                if circuit.state == "half-open" and probe:
+                    circuit.successes += 1
+                    if circuit.successes >= self.half_open_probes:
+                        circuit.state = "closed"
+
+    def is_failure(self, status: Optional[int]) -> bool:
+        """
+            :param status: status code of the response, None if the request failed without a response
+            :return: True if the outcome of the request counts as a failure of the endpoint
+        """
+        return status is None or status in self.failure_status_codes
+
+    def state(self, family: str) -> str:
+        """
+            :param family: endpoint family
+            :return: the state of its circuit: "closed", "open" or "half-open"
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                return "closed"
+            if circuit.state == "open" and time.monotonic() >= circuit.opened_at + self.reset_timeout:
+                return "half-open"
+            return circuit.state
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+            :return: by endpoint family which failed at least once, the state of the circuit, the number of consecutive
+                failures and the number of times the circuit opened
+        """
+        with self._lock:
+            families = list(self._circuits.items())
+        return {family: {"state": self.state(family), "failures": circuit.failures, "opened": circuit.opened}
+                for family, circuit in families}
+
+
+class _Circuit:
+
+    def __init__(self):
+        self.state = "closed"
+        self.failures = 0
+        self.successes = 0
+        self.probes = 0
+        self.opened_at = 0.0
+        self.opened = 0
@@ -0,0 +1,118 @@
+import os
+import shutil
+import uuid
+from typing import Callable, Optional
+
+
+class FileCache:
+    """
+        Content-addressed cache of file binaries on the local disk, keyed by the digest Nexus computes for each file.
+
+        Entries are written atomically (to a temporary file renamed once complete), so an entry is either absent or
+        complete. When the cache grows over `max_bytes`, the least recently used entries are evicted.
+
+        Usage:
+            nexus = NexusClient(environment, token, file_cache=FileCache("~/.cache/nexus", max_bytes=50 * 1024 ** 3))
+            nexus.files.fetch(org, project, file_id, out_filepath="./data/")
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None, hard_link: bool = False):
+        """
+            :param directory: directory where the binaries are stored
+            :param max_bytes: OPTIONAL maximum size in bytes of the cache (default: None, unbounded)
+            :param hard_link: OPTIONAL if True, binaries are exported from the cache with hard links instead of
+                copies when possible. The exported files must then not be modified in place (default: False)
+        """
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.hard_link = hard_link
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get(self, algorithm: str, value: str) -> Optional[str]:
+        """
+            :param algorithm: algorithm of the digest (e.g. SHA-256)
+            :param value: value of the digest
+            :return: the path of the cached binary with this digest, or None if it is not cached
+        """
+        filepath = self._filepath(algorithm, value)
+        if not os.path.exists(filepath):
+            return None
+        # the modification time records the last use for the eviction
+        os.utime(filepath)
+        return filepath
+
+    def put(self, algorithm: str, value: str, write: Callable[[str], None], temporary_suffix: Optional[str] = None) \
+            -> str:
+        """
+            Adds a binary to the cache.
+
+            :param algorithm: algorithm of the digest (e.g. SHA-256)
+            :param value: value of the digest
+            :param write: function writing the binary to the path it is given
+            :param temporary_suffix: OPTIONAL suffix of the temporary file the binary is written to. A fixed suffix
+                allows an interrupted write to be resumed (default: None, a unique suffix)
+            :return: the path of the cached binary
+        """
+        filepath = self._filepath(algorithm, value)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        temporary = filepath + (temporary_suffix or ".%s.tmp" % uuid.uuid4().hex)
+        try:
+            write(temporary)
+            os.replace(temporary, filepath)
+        finally:
+            if temporary_suffix is None and os.path.exists(temporary):
+                os.remove(temporary)
+        self.evict()
+        return filepath
+
+    def export(self, cached_filepath: str, out_filepath: str) -> None:
+        """
+            Copies, or hard links, a cached binary to another path.
+
+            :param cached_filepath: path of the cached binary, as returned by get or put
+            :param out_filepath: path to write
+        """
+        if self.hard_link:
+            try:
+                if os.path.exists(out_filepath):
+                    os.remove(out_filepath)
+                os.link(cached_filepath, out_filepath)
+                return
+            except OSError:
+                # e.g. the cache and the output are not on the same file system
+                pass
+        shutil.copyfile(cached_filepath, out_filepath)
+
+    def evict(self) -> None:
+        """
+            Removes the least recently used binaries until the cache is within its maximum size.
+        """
+        if self.max_bytes is None:
+            return
+        entries = []
+        total = 0
+        for directory, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                filepath = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                total += stat.st_size
+                if not filename.endswith((".tmp", ".part", ".nexus-partial")):
+                    entries.append((stat.st_mtime, stat.st_size, filepath))
+        for _, size, filepath in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(filepath)
+                total -= size
+            except OSError:
+                pass
+
+    def _filepath(self, algorithm: str, value: str) -> str:
+        algorithm = algorithm.replace("-", "").lower()
+        # the digest comes from the server, it must not be able to point outside of the cache
+        if not algorithm.isalnum() or not value.isalnum():
+            raise ValueError("Invalid digest %s:%s." % (algorithm, value))
+        return os.path.join(self.directory, algorithm, value[:2], value)
@@ -1,13 +1,108 @@
 import collections
+import contextlib
+import gzip
+import io
 import json
-from typing import List, Union, Optional
+import socket
+import threading
+import time
+import warnings
+import zlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 import requests
 from sseclient import SSEClient
+from urllib3.exceptions import NewConnectionError
+
+from nexussdk.utils import instrumentation
+from nexussdk.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from nexussdk.utils.instrumentation import RequestEvent
+from nexussdk.utils.json_stream import iter_json_array
+from nexussdk.utils.multipart import MultipartFile
+from nexussdk.utils.rate_limit import RateLimiter
+from nexussdk.utils.response_cache import CachedResponse, ResponseCache
+from nexussdk.utils.retry import RetryPolicy
+from nexussdk.utils.single_flight import SingleFlight
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class EventStream(SSEClient):
+    """
+        SSEClient which can be stopped: SSEClient reconnects whenever its connection ends, so that the iteration only
+        ends with close.
+    """
+
+    _closed = False
+
+    def close(self) -> None:
+        """
+            Close the connection, also from another thread than the one iterating: the iteration ends. If the socket of
+            the connection cannot be reached, it is closed in the background and the iteration ends at the latest with
+            the next event.
+        """
+        self._closed = True
+        # no delay before the reconnection, which ends the iteration
+        self.retry = 0
+        response = getattr(self, "resp", None)
+        if response is None:
+            return
+        # unblocks a thread waiting for the next event, for which closing the response would wait
+        if _shutdown_socket(response):
+            response.close()
+        else:
+            threading.Thread(target=response.close, name="nexussdk-events-close", daemon=True).start()
+
+    def __next__(self):
+        if self._closed:
+            raise StopIteration
+        try:
+            event = super().__next__()
+        except Exception:
+            # reading a response closed by another thread fails in various ways
+            if self._closed:
+                raise StopIteration
+            raise
+        if self._closed:
+            raise StopIteration
+        return event
+
+    def _connect(self):
+        if self._closed:
+            raise StopIteration
+        super()._connect()
+
+
+def _shutdown_socket(response: requests.Response) -> bool:
+    """
+        Shuts down the socket of a streamed response, found in the internals of urllib3 and http.client. Returns False
+        if it could not be found.
+    """
+    try:
+        sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+        if sock is None:
+            # the connection forgets its socket when the server closes the stream at its end: the reader keeps it
+            reader = getattr(getattr(response.raw, "_fp", None), "fp", None)
+            sock = getattr(getattr(reader, "raw", None), "_sock", None)
+        if not isinstance(sock, socket.socket):
+            return False
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        # already closed
+        pass
+    except Exception:
+        return False
+    return True
 
 
 class Http:
     default_type = "json"
+    # True when the verbs are coroutines, see AsyncHttp
+    asynchronous = False
 
     # defines some parts of the header, to combine together
     header_parts = {
@@ -24,12 +119,112 @@ class Http:
         "all": "*/*"
     }
 
-    def __init__(self, environment: str, token: Optional[str] = None):
+    # the JSON responses are negotiated compressed, the binaries are left as they are stored (e.g. for Range requests)
+    header_accept_encoding = {
+        "json": "gzip, deflate",
+    }
+
+    # the ways to compress the bodies of the requests, by value of the Content-Encoding header
+    request_compressors = {
+        "gzip": lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+        "deflate": lambda data, level: zlib.compress(data, level),
+    }
+
+    # the ways to decode the JSON responses, the objects are decoded as dicts (ordered as in the response)
+    # except with "ordered" where they are decoded as OrderedDicts, as in the previous versions of the SDK.
+    # orjson decodes the integers which do not fit in 64 bits as floats, so "fast" is not the default: a fetched
+    # payload written back would not have the same values
+    json_decoders = {
+        "fast": orjson.loads if orjson is not None else json.loads,
+        "standard": json.loads,
+        "ordered": lambda s: json.loads(s, object_pairs_hook=collections.OrderedDict),
+    }
+
+    def __init__(self, environment: str, token: Optional[str] = None, pool_connections: int = 10,
+                 pool_maxsize: int = 10, pool_block: bool = False,
+                 timeout: Optional[Union[float, Tuple[float, float]]] = None, keep_alive: bool = True,
+                 json_decoder: Union[str, Callable[[bytes], Any]] = "standard", compression: Optional[str] = None,
+                 compression_threshold: int = 1024, compression_level: int = 6,
+                 retry: Union[int, RetryPolicy] = 3, rate_limiter: Optional[RateLimiter] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 response_cache: Optional[ResponseCache] = None, coalesce_gets: bool = False):
+        """
+            :param environment: base URL of the Nexus deployment (e.g. https://nexus.example.org/v1)
+            :param token: OPTIONAL bearer token used to authenticate the requests
+            :param pool_connections: OPTIONAL number of per-host connection pools to cache (default: 10)
+            :param pool_maxsize: OPTIONAL maximum number of connections kept alive per host (default: 10)
+            :param pool_block: OPTIONAL if True, wait for a free connection when the pool of a host is exhausted
+                instead of opening a throw-away one (default: False)
+            :param timeout: OPTIONAL socket timeout in seconds, either a single value or a (connect, read) tuple
+                (default: None, waits forever)
+            :param keep_alive: OPTIONAL if False, connections are closed after each request (default: True)
+            :param json_decoder: OPTIONAL how to decode the JSON responses: "standard" (json), "fast" (orjson if
+                installed, json otherwise, the integers which do not fit in 64 bits are decoded as floats), "ordered"
+                (json, objects as OrderedDicts) or a function decoding bytes (default: "standard")
+            :param compression: OPTIONAL "gzip" or "deflate" to compress the bodies of the POST, PUT and PATCH requests
+                which are not files. The deployment must accept compressed requests (default: None, not compressed)
+            :param compression_threshold: OPTIONAL minimum size in bytes of a body to compress it, smaller bodies are
+                sent as they are because the compression would not save time (default: 1024)
+            :param compression_level: OPTIONAL level of the compression, from 1 (fastest) to 9 (smallest) (default: 6)
+            :param retry: OPTIONAL policy to retry the requests which failed transiently, or the maximum number of
+                retries with the default RetryPolicy, 0 to disable the retries (default: 3)
+            :param rate_limiter: OPTIONAL limits of the rate of the requests and of the requests in flight, by endpoint
+                family. A request is in flight until its response headers are received (default: None, unlimited)
+            :param circuit_breaker: OPTIONAL circuit breaker making the requests to an endpoint family which keeps
+                failing fail immediately with a CircuitOpenError (default: None)
+            :param response_cache: OPTIONAL cache of the JSON responses of the GET requests, revalidated with
+                conditional requests (default: None)
+            :param coalesce_gets: OPTIONAL if True, identical GET requests for JSON sent while one of them is in flight
+                wait for its response instead of being sent (default: False)
+        """
+        if compression is not None and compression not in Http.request_compressors:
+            raise ValueError("Unsupported compression %s, expecting one of %s."
+                             % (compression, ", ".join(Http.request_compressors)))
         self.env = environment
         self.token = token
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self.retry = retry if isinstance(retry, RetryPolicy) else RetryPolicy(total=retry)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self._single_flight = SingleFlight() if coalesce_gets else None
+        self._base_path = urlparse(environment).path.rstrip("/")
+        self._decode_json = json_decoder if callable(json_decoder) else Http.json_decoders[json_decoder]
+        self._hooks = []
+        self._session = requests.Session()
+        adapter = instrumentation.TimedHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                                   pool_block=pool_block)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def close(self):
+        """
+            Close the connections kept alive in the pool.
+        """
+        self._session.close()
+
+    def add_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+            Register a function called with the measures of every request once it is completed, e.g. to feed a metrics
+            pipeline. The hooks are called in the thread which sent the request, they must be fast and thread-safe.
+
+            :param hook: function taking a RequestEvent
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], None]) -> None:
+        """
+            Unregister a function registered with add_hook.
+        """
+        self._hooks.remove(hook)
 
     def get(this, path: Union[str, List[str]], stream=False, get_raw_response=False, use_base=False,
-            data_type=default_type, accept="json", **kwargs):
+            data_type=default_type, accept="json", headers: Optional[Dict] = None, items_path: Optional[str] = None,
+            **kwargs):
         """
             Wrapper to perform a GET request.
 
@@ -41,30 +236,39 @@ class Http:
             (convenient when getting a binary file). If False, a dictionary representation of the response will be returned
             (default: False)
             :param stream: OPTIONAL True if GETting a file (default: False)
+            :param headers: OPTIONAL additional headers to send (e.g. Range)
+            :param items_path: OPTIONAL dot-separated keys of an array of the JSON response (e.g. "_results"). If
+                provided, the response is parsed incrementally while it is received and an iterator of the elements of
+                this array is returned, so the whole response is never held in memory (default: None)
             :return: if get_raw_response is True, returns the request.get object. If get_raw_response is False, return the
             dictionary that is equivalent to the json response
         """
-        header = this._prepare_header(data_type, accept)
+        header = {**this._prepare_header(data_type, accept), **(headers or {})}
         full_url = this._full_url(path, use_base)
+        stream = stream or items_path is not None
         params = kwargs.pop("params", None)
-        if params:
-            response = requests.get(full_url, headers=header, stream=stream, params=params, **kwargs)
-        else:
-            response = requests.get(full_url, headers=header, stream=stream, params=kwargs)
-        response.raise_for_status()
-
-        if get_raw_response:
-            return response
-        else:
-            return this._decode_json_ordered(response.text)
-
-    def post(self, path: Union[str, List[str]], body=None, data_type=default_type, use_base=False, **kwargs):
+        if not params:
+            params, kwargs = kwargs, {}
+        decode = not get_raw_response and items_path is None
+        response = this._request("GET", full_url, decode=decode, headers=header, stream=stream, params=params,
+                                 **kwargs)
+
+        if items_path is not None and not get_raw_response:
+            return this._iter_items(response, items_path)
+        return response
+
+    def post(self, path: Union[str, List[str]], body=None, data_type=default_type, use_base=False,
+             items_path: Optional[str] = None, **kwargs):
         """
             Perform a POST request.
 
             :param path: complete URL if use_base si False or just the ending if use_base is True
-            :param body: OPTIONAL Things to send, can be a dictionary
-            :param data_type: OPTIONAL can be "json" or "text" (default: "default" = "json")
+            :param body: OPTIONAL Things to send, can be a dictionary, or a MultipartFile streamed from disk when
+                data_type is "file"
+            :param data_type: OPTIONAL can be "json" or "text" or "file" (default: "default" = "json")
+            :param items_path: OPTIONAL dot-separated keys of an array of the JSON response (e.g. "hits.hits"). If
+                provided, an iterator of the elements of this array, parsed while the response is received, is
+                returned instead of the whole response (default: None)
             :param params: OPTIONAL provide some URL parameters (?foo=bar&hello=world) as a dictionary
             :return: the dictionary that is equivalent to the json response
         """
@@ -72,25 +276,34 @@ class Http:
         full_url = self._full_url(path, use_base)
 
         # body_data = prepare_body(body, data_type)
-        # response = requests.post(full_url, headers=header, data=body_data, params=kwargs)
+        # response = self._request("POST", full_url, headers=header, data=body_data, params=kwargs)
 
         response = None
+        stream = items_path is not None
 
         if data_type != "file":
-            body_data = self._prepare_body(body, data_type)
-            response = requests.post(full_url, headers=header, data=body_data, params=kwargs)
+            body_data = self._compress_body(header, self._prepare_body(body, data_type))
+            response = self._request("POST", full_url, decode=not stream, headers=header, data=body_data,
+                                     params=kwargs, stream=stream)
+        elif isinstance(body, MultipartFile):
+            header["Content-Type"] = body.content_type
+            response = self._request("POST", full_url, decode=not stream, headers=header, data=body, params=kwargs,
+                                     stream=stream)
         else:
-            response = requests.post(full_url, headers=header, files=body, params=kwargs)
+            response = self._request("POST", full_url, decode=not stream, headers=header, files=body, params=kwargs,
+                                     stream=stream)
 
-        response.raise_for_status()
-        return self._decode_json_ordered(response.text)
+        if stream:
+            return self._iter_items(response, items_path)
+        return response
 
     def put(self, path: Union[str, List[str]], body=None, data_type=default_type, use_base=False, **kwargs):
         """
             Performs a PUT request
 
             :param path: complete URL if use_base si False or just the ending if use_base is True
-            :param body: OPTIONAL Things to send, can be a dictionary or a buffer
+            :param body: OPTIONAL Things to send, can be a dictionary or a buffer, or a MultipartFile streamed from
+                disk when data_type is "file"
             :param data_type: OPTIONAL can be "json" or "text" or "file" (default: "default" = "json")
             :param use_base: OPTIONAL if True, the Nexus env provided by nexus.config.set_environment will
             be prepended to path. (default: False)
@@ -100,16 +313,15 @@ class Http:
         """
         header = self._prepare_header(type=data_type)
         full_url = self._full_url(path, use_base)
-        response = None
 
         if data_type != "file":
-            body_data = self._prepare_body(body, data_type)
-            response = requests.put(full_url, headers=header, data=body_data, params=kwargs)
+            body_data = self._compress_body(header, self._prepare_body(body, data_type))
+            return self._request("PUT", full_url, decode=True, headers=header, data=body_data, params=kwargs)
+        elif isinstance(body, MultipartFile):
+            header["Content-Type"] = body.content_type
+            return self._request("PUT", full_url, decode=True, headers=header, data=body, params=kwargs)
         else:
-            response = requests.put(full_url, headers=header, files=body, params=kwargs)
-
-        response.raise_for_status()
-        return self._decode_json_ordered(response.text)
+            return self._request("PUT", full_url, decode=True, headers=header, files=body, params=kwargs)
 
     def patch(self, path: Union[str, List[str]], body=None, data_type=default_type, use_base=False, **kwargs):
         """
@@ -125,10 +337,8 @@ class Http:
         """
         header = self._prepare_header()
         full_url = self._full_url(path, use_base)
-        body_data = self._prepare_body(body, data_type)
-        response = requests.patch(full_url, headers=header, data=body_data, params=kwargs)
-        response.raise_for_status()
-        return self._decode_json_ordered(response.text)
+        body_data = self._compress_body(header, self._prepare_body(body, data_type))
+        return self._request("PATCH", full_url, decode=True, headers=header, data=body_data, params=kwargs)
 
     def delete(self, path: Union[str, List[str]], body=None, data_type=default_type, use_base=False, **kwargs):
         """
@@ -145,9 +355,7 @@ class Http:
         header = self._prepare_header()
         full_url = self._full_url(path, use_base)
         body_data = self._prepare_body(body, data_type)
-        response = requests.delete(full_url, headers=header, data=body_data, params=kwargs)
-        response.raise_for_status()
-        return self._decode_json_ordered(response.text)
+        return self._request("DELETE", full_url, decode=True, headers=header, data=body_data, params=kwargs)
 
     def sse_request(self, path: str, last_id: Optional[str], ):
         """
@@ -156,11 +364,218 @@ class Http:
             :param path: path of the request
             :param last_id: ID of the last processed event, if provided, only events after
                     the event with the provided ID will be returned.
-            :return: iterator of SSE events
+            :return: iterator of SSE events, whose close method stops it
+        """
+        return EventStream(self._full_url(path, True), last_id, session=self._session, headers=self._prepare_header())
+
+    def require_sync(self, feature: str) -> None:
+        """
+            Raise a TypeError if the verbs are coroutines, for the helpers which use their results directly.
+
+            :param feature: name of the helper, for the error message
         """
-        return SSEClient(self._full_url(path, True), last_id, headers=self._prepare_header())
+        if self.asynchronous:
+            raise TypeError("%s is not available with AsyncNexusClient, use NexusClient instead." % feature)
 
     # Internal helpers
+    def _request(self, method: str, url: str, decode: bool = False, **kwargs):
+        """
+            Send a request through the pooled session, retry it according to the retry policy if it failed
+            transiently, and raise an HTTPError if it failed, or a CircuitOpenError if its endpoint keeps failing.
+
+            :param decode: OPTIONAL if True, return the decoded JSON response instead of the response (default: False)
+        """
+        if self._single_flight is not None and method == "GET" and decode:
+            key = self._flight_key(url, kwargs)
+            return self._single_flight.do(key, lambda: self._execute(method, url, decode, **kwargs))
+        return self._execute(method, url, decode, **kwargs)
+
+    def _execute(self, method: str, url: str, decode: bool, **kwargs):
+        """
+            Body of _request, without the coalescing.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if not self.keep_alive:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "Connection": "close"}
+        # a body read from a file (e.g. a MultipartFile) must be rewound to be sent again
+        body = kwargs.get("data")
+        position = body.tell() if isinstance(body, io.IOBase) else None
+        cache_key, cached = self._cache_lookup(method, url, kwargs.get("params"), kwargs.get("headers", {}), decode)
+        if cached is not None and cached.immutable:
+            return self._decode_json(cached.content)
+        if cached is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **cached.validators()}
+        family = self._endpoint_family(url)
+        event = RequestEvent(method, self._path_template(url), family) if self._hooks else None
+        started = time.monotonic()
+        first_attempt_end = None
+        retries = 0
+        while True:
+            if retries and position is not None:
+                body.seek(position)
+            response, error = None, None
+            instrumentation.reset_connect_seconds()
+            try:
+                probe = self.circuit_breaker.before(family) if self.circuit_breaker is not None else False
+            except CircuitOpenError as e:
+                # the request is not sent, it is counted and measured as a failure without a response
+                error = e
+                first_attempt_end = first_attempt_end or time.monotonic()
+                break
+            try:
+                with self._limit(family):
+                    response = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            finally:
+                if self.circuit_breaker is not None:
+                    status = response.status_code if response is not None else None
+                    self.circuit_breaker.after(family, self.circuit_breaker.is_failure(status), probe)
+            now = time.monotonic()
+            first_attempt_end = first_attempt_end or now
+            if response is not None:
+                delay = self.retry.delay(method, retries, now - started, response.status_code,
+                                         response.headers.get("Retry-After"))
+            else:
+                delay = self.retry.delay(method, retries, now - started, sent=not _connection_failed(error))
+            if delay is None:
+                break
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            retries += 1
+        failed = error is not None or response.status_code in self.retry.status_codes
+        self.retry.record(retries, time.monotonic() - first_attempt_end, not failed)
+        try:
+            if error is not None:
+                raise error
+            response.raise_for_status()
+            if not decode:
+                return response
+            content = cached.content if cached is not None and response.status_code == 304 else response.content
+            decode_started = time.monotonic()
+            result = self._decode_json(content)
+            if event is not None:
+                event.decode_seconds = time.monotonic() - decode_started
+            if cache_key is not None:
+                self._cache_store(cache_key, cached, url, kwargs.get("params"), response.status_code,
+                                  response.headers, content, result)
+            return result
+        finally:
+            if event is not None:
+                event.retries = retries
+                event.total_seconds = time.monotonic() - started
+                self._measure(event, response, error, kwargs.get("stream", False))
+                self._emit(event)
+
+    @staticmethod
+    def _flight_key(url: str, kwargs: Dict) -> str:
+        """
+            Identity of a request for the coalescing: its URL, parameters and headers.
+        """
+        params = {k: str(v) for k, v in (kwargs.get("params") or {}).items() if v is not None}
+        return json.dumps([url, params, kwargs.get("headers") or {}], sort_keys=True)
+
+    def _cache_lookup(self, method: str, url: str, params: Optional[Dict], headers: Dict, decode: bool) \
+            -> Tuple[Optional[str], Optional[CachedResponse]]:
+        """
+            Key and cached response of a request, if it can be served by the response cache.
+        """
+        if self.response_cache is None or method != "GET" or not decode:
+            return None, None
+        key = self.response_cache.key(url, params, headers.get("Accept"), self.token)
+        cached = self.response_cache.get(key)
+        if cached is not None and cached.immutable:
+            self.response_cache.count("hits")
+        return key, cached
+
+    def _cache_store(self, key: str, cached: Optional[CachedResponse], url: str, params: Optional[Dict],
+                     status: int, headers, content: bytes, result) -> None:
+        """
+            Store a response in the response cache if it is immutable or has validators.
+        """
+        if cached is not None and status == 304:
+            self.response_cache.count("revalidated")
+            return
+        self.response_cache.count("misses")
+        # a listing filtered by revision (e.g. Resources.list with rev) is not pinned to a version of one resource
+        listing = isinstance(result, dict) and "_results" in result
+        immutable = self.response_cache.is_pinned(url, params) and not listing
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if immutable or etag is not None or last_modified is not None:
+            self.response_cache.put(key, CachedResponse(content, etag, last_modified, immutable))
+
+    @staticmethod
+    def _measure(event: RequestEvent, response: Optional[requests.Response], error: Optional[Exception],
+                 stream: bool) -> None:
+        """
+            Fill an event with the measures of the last attempt of its request.
+        """
+        event.connect_seconds = instrumentation.connect_seconds()
+        if response is None:
+            event.error = type(error).__name__
+            return
+        event.status = response.status_code
+        event.bytes_sent = int(response.request.headers.get("Content-Length", 0))
+        # the length on the wire, which is smaller than the content when the response is compressed
+        if "Content-Length" in response.headers:
+            event.bytes_received = int(response.headers["Content-Length"])
+        elif not stream:
+            event.bytes_received = len(response.content)
+        # the time measured by requests includes the opening of the connection
+        event.ttfb_seconds = response.elapsed.total_seconds() - (event.connect_seconds or 0.0)
+
+    def _emit(self, event: RequestEvent) -> None:
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                # the measures must not make the requests fail
+                warnings.warn("The hook %r failed: %r" % (hook, e), RuntimeWarning)
+
+    def _limit(self, family: str):
+        """
+            Context manager waiting until the rate limiter, if any, allows to send a request to the endpoint family.
+        """
+        if self.rate_limiter is None:
+            return contextlib.nullcontext()
+        return self.rate_limiter.slot(family)
+
+    def _endpoint_family(self, url: str) -> str:
+        """
+            Family of the endpoint of a URL: the name of the sub-API (e.g. "resources", "files", "views"), followed by
+            "/_search" or "/sparql" for the queries of views, which are served by other back-ends.
+        """
+        segments = self._path_segments(url)
+        if not segments:
+            return ""
+        if len(segments) > 1 and segments[-1] in ("_search", "sparql"):
+            return segments[0] + "/" + segments[-1]
+        return segments[0]
+
+    def _path_template(self, url: str) -> str:
+        """
+            Path of a URL relative to the deployment, with the labels and ids replaced by placeholders
+            (e.g. "/resources/{org}/{project}/{id}/{id}").
+        """
+        return instrumentation.path_template(self._path_segments(url))
+
+    def _path_segments(self, url: str) -> List[str]:
+        path = urlparse(url).path
+        if self._base_path and (path + "/").startswith(self._base_path + "/"):
+            path = path[len(self._base_path):]
+        return [segment for segment in path.split("/") if segment]
+
+    @staticmethod
+    def _iter_items(response: requests.Response, items_path: str) -> Iterator[Any]:
+        """
+            Yield the elements of an array of a streamed JSON response, then release the connection.
+        """
+        try:
+            yield from iter_json_array(response.iter_content(chunk_size=64 * 1024), items_path)
+        finally:
+            response.close()
+
     def _full_url(self, path: Union[str, List[str]], use_base: bool) -> str:
         # 'use_base' is temporary for compatibility with previous code sections.
         if use_base:
@@ -189,6 +604,8 @@ class Http:
 
         if accept in Http.header_accept:
             header["Accept"] = Http.header_accept[accept]
+        if accept in Http.header_accept_encoding:
+            header["Accept-Encoding"] = Http.header_accept_encoding[accept]
 
         if self.token:
             header["Authorization"] = "Bearer " + self.token
@@ -214,6 +631,27 @@ class Http:
 
         return body
 
-    # to make sure the output response dictionary are always ordered like the response's json
-    def _decode_json_ordered(self, s: str):
-        return json.JSONDecoder(object_pairs_hook=collections.OrderedDict).decode(s)
+    def _compress_body(self, header: Dict, body):
+        """
+            Compress the body of a request if the compression is enabled and the body is large enough, and declare it
+            in the header.
+
+            :param header: header of the request, updated with the Content-Encoding
+            :param body: body as prepared by _prepare_body
+            :return: the body to send
+        """
+        if self.compression is None or not isinstance(body, (str, bytes)):
+            return body
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        if len(data) < self.compression_threshold:
+            return body
+        header["Content-Encoding"] = self.compression
+        return Http.request_compressors[self.compression](data, self.compression_level)
+
+
+def _connection_failed(error: Exception) -> bool:
+    # the request could not be sent: the connection was not established
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(error, requests.ConnectionError) and isinstance(reason, NewConnectionError)
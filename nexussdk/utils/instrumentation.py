@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Dict, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class RequestEvent:
+    """
+        Measures of a request sent by Http, given to the hooks registered with Http.add_hook once it is completed.
+
+        The timings are in seconds. When a request is retried, connect_seconds and ttfb_seconds are the ones of its last
+        attempt while total_seconds covers all the attempts and the waits between them. The timings which could not be
+        measured are None, e.g. dns_seconds with the synchronous transport, where the DNS resolution is part of
+        connect_seconds.
+
+        Attributes:
+            method: verb of the request (e.g. "GET")
+            path: path of the request relative to the deployment, with the labels and ids replaced by placeholders
+                (e.g. "/resources/{org}/{project}/{id}/{id}"), to aggregate the requests to the same endpoint
+            family: endpoint family of the request (e.g. "resources", "views/_search")
+            status: status code of the response, None if there was none
+            error: name of the exception of a request which failed without a response, None otherwise
+            bytes_sent: size of the body of the request
+            bytes_received: size of the body of the response as received, None if it was streamed without a length
+            dns_seconds: time to resolve the host name, None if the connection was reused or if not measured
+            connect_seconds: time to open the connection (TLS included), None if the connection was reused
+            ttfb_seconds: time from the sending of the request to the reception of the response headers
+            total_seconds: time from the sending of the request until its response is read and decoded
+            decode_seconds: time to decode the JSON response, None if it was not decoded
+            retries: number of times the request has been retried
+    """
+
+    __slots__ = ("method", "path", "family", "status", "error", "bytes_sent", "bytes_received", "dns_seconds",
+                 "connect_seconds", "ttfb_seconds", "total_seconds", "decode_seconds", "retries")
+
+    def __init__(self, method: str, path: str, family: str):
+        self.method = method
+        self.path = path
+        self.family = family
+        self.status = None
+        self.error = None
+        self.bytes_sent = 0
+        self.bytes_received = None
+        self.dns_seconds = None
+        self.connect_seconds = None
+        self.ttfb_seconds = None
+        self.total_seconds = None
+        self.decode_seconds = None
+        self.retries = 0
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return "RequestEvent(%s)" % ", ".join("%s=%r" % item for item in self.to_dict().items())
+
+
+# segments of the paths of the API which are not labels nor ids
+_keywords = frozenset(("events", "tags", "source", "incoming", "outgoing", "statistics", "offset", "sparql",
+                       "attributes", "minds", "me"))
+# sub-APIs whose first segments are not an organization and a project
+_unscoped = frozenset(("realms", "permissions", "identities"))
+
+
+def path_template(segments: List[str]) -> str:
+    """
+        :param segments: segments of the path of a request, relative to the deployment
+        :return: the path with the organization, the project and the ids replaced by placeholders
+    """
+    if not segments:
+        return "/"
+    template = [segments[0]]
+    for position, segment in enumerate(segments[1:], 1):
+        if segment.startswith("_") or segment in _keywords:
+            template.append(segment)
+        elif position == 1 and segments[0] not in _unscoped:
+            template.append("{org}")
+        elif position == 2 and segments[0] not in _unscoped:
+            template.append("{project}")
+        else:
+            template.append("{id}")
+    return "/" + "/".join(template)
+
+
+# time to open the last connection of the current thread, None if it reused one
+_connections = threading.local()
+
+
+def reset_connect_seconds() -> None:
+    _connections.seconds = None
+
+
+def connect_seconds() -> Optional[float]:
+    return getattr(_connections, "seconds", None)
+
+
+class _TimedHTTPConnection(HTTPConnection):
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _connections.seconds = time.perf_counter() - started
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _connections.seconds = time.perf_counter() - started
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+        HTTPAdapter whose connections record the time they take to open, see connect_seconds.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TimedHTTPConnectionPool,
+                                                   "https": _TimedHTTPSConnectionPool}
@@ -0,0 +1,124 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List, Union
+
+
+def iter_json_array(chunks: Iterable[bytes], path: Union[str, List[str]]) -> Iterator[Any]:
+    """
+        Parses a JSON document incrementally and yields the elements of one of its arrays, one by one.
+
+        Only the element being parsed is held in memory, in addition to the chunk being read. The array is reached by
+        following the keys of its path from the root object. The values met on the way are skipped.
+
+        :param chunks: the JSON document as an iterable of chunks of bytes (e.g. response.iter_content())
+        :param path: keys leading to the array, as a list or as a string where they are separated by dots
+            (e.g. "hits.hits" for an Elasticsearch response, "_results" for a Nexus listing)
+        :return: iterator of the decoded elements of the array. Nothing is yielded if the path does not exist.
+    """
+    keys = path.split(".") if isinstance(path, str) else list(path)
+    reader = _Reader(iter(chunks))
+    if not reader.find(keys):
+        return
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.next_of(",]") == "]":
+            return
+
+
+class _Reader:
+    """
+        Cursor on a JSON document read from chunks of bytes. The text already consumed is dropped from the buffer.
+    """
+    _decoder = json.JSONDecoder()
+    _whitespaces = " \t\n\r"
+    _delimiters = ",:]}" + _whitespaces
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def find(self, keys: List[str]) -> bool:
+        """
+            Moves the cursor to the value at the end of the path of keys. Returns False if there is none.
+        """
+        for key in keys:
+            if self.next_of("{") is None:
+                return False
+            while True:
+                if self.peek() == "}":
+                    return False
+                name = self.value()
+                self.expect(":")
+                if name == key:
+                    break
+                self.value()
+                if self.next_of(",}") == "}":
+                    return False
+        return True
+
+    def value(self) -> Any:
+        """
+            Decodes the value at the cursor and moves the cursor after it.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # a number could be cut at the end of the buffer or after a ".", an "e" or a sign: a value is only
+                # complete when it is followed by something which cannot continue it
+                if self._eof or (end < len(self._buffer) and self._buffer[end] in self._delimiters):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # read at least as much as what is already buffered, so the value is not parsed again too many times
+            self._read(len(self._buffer) - self._position)
+
+    def peek(self) -> str:
+        """
+            Returns the next non-whitespace character, without consuming it.
+        """
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in self._whitespaces:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                raise json.JSONDecodeError("Unexpected end of the JSON document", self._buffer, self._position)
+
+    def next_of(self, characters: str):
+        """
+            Consumes the next non-whitespace character and returns it if it is one of the given ones, None otherwise.
+        """
+        character = self.peek()
+        self._position += 1
+        return character if character in characters else None
+
+    def expect(self, character: str) -> None:
+        if self.next_of(character) is None:
+            raise json.JSONDecodeError("Expecting '%s'" % character, self._buffer, self._position - 1)
+
+    def _read(self, at_least: int = 1) -> bool:
+        # drop what has been consumed, so the buffer only holds the value being parsed
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        read = 0
+        while read < at_least:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                text = self._text_decoder.decode(b"", final=True)
+                self._eof = True
+            else:
+                text = self._text_decoder.decode(chunk)
+            self._buffer += text
+            read += len(text)
+            if self._eof:
+                break
+        return read > 0
@@ -0,0 +1,155 @@
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Sequence, Tuple
+
+from nexussdk.utils.instrumentation import RequestEvent
+
+
+class MetricsRegistry:
+    """
+        In-process aggregation of the measures of the requests, by sub-API (e.g. "resources", "files", "views") and
+        verb, exposed in the Prometheus text format.
+
+        The registry is fed by the hooks of Http (see Http.add_hook). It is thread-safe and can be shared by several
+        clients.
+
+        Usage:
+            metrics = MetricsRegistry()
+            nexus = NexusClient(environment, token, metrics=metrics)
+            metrics.serve(9464)  # or metrics.render() to get the text
+    """
+
+    default_buckets = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, namespace: str = "nexussdk", buckets: Sequence[float] = default_buckets):
+        """
+            :param namespace: OPTIONAL prefix of the names of the metrics (default: "nexussdk")
+            :param buckets: OPTIONAL upper bounds in seconds of the buckets of the latency histograms
+                (default: from 5 ms to 30 s)
+        """
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # by (sub-API, verb): [count by bucket (the last one is +Inf), sum of the durations]
+        self._durations = {}
+        # by (sub-API, verb, status)
+        self._requests = {}
+        # by (sub-API, verb)
+        self._errors = {}
+        self._retries = {}
+        self._decode_seconds = {}
+        # by sub-API
+        self._bytes_sent = {}
+        self._bytes_received = {}
+
+    def observe(self, event: RequestEvent) -> None:
+        """
+            Adds the measures of a request. This is the hook to register with Http.add_hook.
+
+            :param event: measures of the request
+        """
+        api = event.family.split("/")[0] or "root"
+        key = (api, event.method)
+        status = str(event.status) if event.status is not None else "none"
+        with self._lock:
+            histogram = self._durations.get(key)
+            if histogram is None:
+                histogram = self._durations[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            histogram[0][bisect.bisect_left(self.buckets, event.total_seconds)] += 1
+            histogram[1] += event.total_seconds
+            _add(self._requests, key + (status,), 1)
+            if event.status is None or event.status >= 400:
+                _add(self._errors, key, 1)
+            _add(self._retries, key, event.retries)
+            _add(self._decode_seconds, key, event.decode_seconds or 0.0)
+            _add(self._bytes_sent, (api,), event.bytes_sent or 0)
+            _add(self._bytes_received, (api,), event.bytes_received or 0)
+
+    def render(self) -> str:
+        """
+            :return: the metrics in the Prometheus text exposition format (version 0.0.4)
+        """
+        with self._lock:
+            durations = {key: ([*counts], total) for key, (counts, total) in self._durations.items()}
+            counters = [
+                ("requests_total", "Requests completed, by status code (none if there was no response).",
+                 ("api", "method", "status"), dict(self._requests)),
+                ("request_errors_total", "Requests which failed with an error status code or without a response.",
+                 ("api", "method"), dict(self._errors)),
+                ("request_retries_total", "Retries of the requests.", ("api", "method"), dict(self._retries)),
+                ("response_decode_seconds_total", "Time spent decoding the JSON responses.", ("api", "method"),
+                 dict(self._decode_seconds)),
+                ("request_bytes_sent_total", "Bytes sent in the bodies of the requests.", ("api",),
+                 dict(self._bytes_sent)),
+                ("response_bytes_received_total", "Bytes received in the bodies of the responses.", ("api",),
+                 dict(self._bytes_received)),
+            ]
+        name = self.namespace + "_request_duration_seconds"
+        lines = ["# HELP %s Duration of the requests, retries included." % name, "# TYPE %s histogram" % name]
+        for key, (counts, total) in sorted(durations.items()):
+            labels = _labels(("api", "method"), key)
+            cumulated = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulated += count
+                lines.append('%s_bucket{%s,le="%s"} %d' % (name, labels, _number(bound), cumulated))
+            lines.append("%s_sum{%s} %s" % (name, labels, _number(total)))
+            lines.append("%s_count{%s} %d" % (name, labels, cumulated))
+        for suffix, description, label_names, values in counters:
+            name = self.namespace + "_" + suffix
+            lines += ["# HELP %s %s" % (name, description), "# TYPE %s counter" % name]
+            for key, value in sorted(values.items()):
+                lines.append("%s{%s} %s" % (name, _labels(label_names, key), _number(value)))
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, address: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+            Serves the metrics on http://address:port/metrics from a background thread, to be scraped by Prometheus.
+
+            :param port: port to listen on, 0 for any free port
+            :param address: OPTIONAL address to listen on (default: "127.0.0.1", only local connections)
+            :return: the server, whose shutdown method stops it
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((address, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="nexussdk-metrics", daemon=True).start()
+        return server
+
+    def reset(self) -> None:
+        with self._lock:
+            for values in (self._durations, self._requests, self._errors, self._retries, self._decode_seconds,
+                           self._bytes_sent, self._bytes_received):
+                values.clear()
+
+
+def _add(values: Dict, key: Tuple, amount) -> None:
+    values[key] = values.get(key, 0) + amount
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    escaped = (str(v).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for v in values)
+    return ",".join('%s="%s"' % pair for pair in zip(names, escaped))
+
+
+def _number(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
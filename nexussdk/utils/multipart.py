@@ -0,0 +1,106 @@
+import hashlib
+import io
+import os
+import uuid
+from typing import Iterator, Optional
+
+
+class MultipartFile(io.IOBase):
+    """
+        Read-only file-like multipart/form-data body holding a single file field.
+
+        The file is read from disk by chunks while the body is sent, so the memory used does not depend on the size of
+        the file. The length of the body is known in advance, so it is sent with a Content-Length header rather than
+        with chunked transfer encoding. The digest of the file is computed on the fly, while the body is read.
+
+        Usage:
+            with MultipartFile("data.bin", "data.bin", "application/octet-stream") as body:
+                http.post(path, body=body, data_type="file")
+    """
+
+    def __init__(self, filepath: str, filename: str, content_type: str, field_name: str = "file",
+                 digest_algorithm: str = "sha256"):
+        """
+            :param filepath: path of the file to send
+            :param filename: filename declared in the body
+            :param content_type: content type of the file
+            :param field_name: OPTIONAL name of the form field (default: "file")
+            :param digest_algorithm: OPTIONAL hashlib name of the algorithm of the digest (default: "sha256")
+        """
+        super().__init__()
+        boundary = uuid.uuid4().hex
+        self.content_type = "multipart/form-data; boundary=" + boundary
+        self._head = ("--%s\r\nContent-Disposition: form-data; name=\"%s\"; filename=\"%s\"\r\n"
+                      "Content-Type: %s\r\n\r\n" % (boundary, _quote(field_name), _quote(filename),
+                                                    content_type)).encode("utf-8")
+        self._tail = ("\r\n--%s--\r\n" % boundary).encode("utf-8")
+        self._file = open(filepath, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._position = 0
+        self.digest_algorithm = digest_algorithm
+        self._hash = hashlib.new(digest_algorithm)
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(1024 * 1024), b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self) - self._position
+        file_end = len(self._head) + self._size
+        chunks = []
+        while size > 0 and self._position < len(self):
+            if self._position < len(self._head):
+                chunk = self._head[self._position:self._position + size]
+            elif self._position < file_end:
+                chunk = self._file.read(min(size, file_end - self._position))
+                if not chunk:
+                    raise IOError("The file %s was truncated while being sent." % self._file.name)
+                if self._hash is not None:
+                    self._hash.update(chunk)
+            else:
+                offset = self._position - file_end
+                chunk = self._tail[offset:offset + size]
+            self._position += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self)
+        self._position = max(0, min(offset, len(self)))
+        self._file.seek(max(0, min(self._position - len(self._head), self._size)))
+        # the digest can only be computed again if the file is read again from its beginning
+        self._hash = hashlib.new(self.digest_algorithm) if self._position <= len(self._head) else None
+        return self._position
+
+    def hexdigest(self) -> Optional[str]:
+        """
+            :return: the digest of the file if it has been entirely read, None otherwise
+        """
+        if self._hash is None or self._position < len(self._head) + self._size:
+            return None
+        return self._hash.hexdigest()
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def _quote(value: str) -> str:
+    # same escaping as browsers (and urllib3) for the parameters of the Content-Disposition header
+    return value.translate({10: "%0A", 13: "%0D", 34: "%22"})
@@ -0,0 +1,119 @@
+import queue
+import threading
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from nexussdk.utils.http import Http
+
+
+def iter_results(http: Http, fetch_page: Callable[[int, int], Dict], pagination_from: Optional[int] = 0,
+                 pagination_size: Optional[int] = 20, max_pages: int = 1) -> Iterator[Dict]:
+    """
+        Iterate lazily over the `_results` of a Nexus listing, page after page.
+
+        The next page is given by the `_next` link of the current one when Nexus provides it, and the listing ends at
+        the first page without it. Otherwise, it is requested with from/size until a page is not full or `_total` is
+        reached.
+
+        :param http: the Http instance used to follow the `_next` links
+        :param fetch_page: function returning the listing page for a given (from, size)
+        :param pagination_from: OPTIONAL The pagination index to start from (default: 0)
+        :param pagination_size: OPTIONAL The number of elements per page (default: 20)
+        :param max_pages: OPTIONAL maximum number of pages held in memory, including the one being consumed.
+            If greater than 1, the next pages are fetched in the background while the current one is consumed
+            (default: 1, no prefetching)
+        :return: iterator of the listed elements
+    """
+    http.require_sync("iter_list")
+    pages = _pages(http, fetch_page, pagination_from or 0, pagination_size or 20)
+    if max_pages > 1:
+        pages = _prefetch(pages, max_pages)
+    return (result for _, page in pages for result in page["_results"])
+
+
+def iter_results_resumable(http: Http, fetch_page: Callable[[int, int], Dict], cursor: Optional[Dict] = None,
+                           pagination_size: int = 20, max_pages: int = 1) -> Iterator[Tuple[Dict, Dict]]:
+    """
+        Iterate lazily over the `_results` of a Nexus listing like iter_results, with the cursor after each element.
+        A cursor is a JSON-serializable dictionary: the `_next` link or the from index of the page of the element, and
+        the number of elements of this page already consumed. Unlike a from index, it reaches the pages which are
+        only given by `_next` links (the from/size pagination of Nexus is limited to the first elements).
+
+        :param http: the Http instance used to follow the `_next` links
+        :param fetch_page: function returning the listing page for a given (from, size)
+        :param cursor: OPTIONAL cursor to resume the iteration from (default: None, from the first element)
+        :param pagination_size: OPTIONAL The number of elements per page (default: 20)
+        :param max_pages: OPTIONAL maximum number of pages held in memory, see iter_results (default: 1)
+        :return: iterator of (element, cursor after the element) tuples
+    """
+    http.require_sync("iter_list")
+    cursor = cursor or {}
+    pages = _pages(http, fetch_page, cursor.get("from", 0), pagination_size, cursor.get("next"))
+    if max_pages > 1:
+        pages = _prefetch(pages, max_pages)
+    return _resume(pages, cursor.get("consumed", 0))
+
+
+def _resume(pages: Iterator[Tuple[Dict, Dict]], consumed: int) -> Iterator[Tuple[Dict, Dict]]:
+    for origin, page in pages:
+        for index, result in enumerate(page["_results"][consumed:], consumed + 1):
+            yield result, {**origin, "consumed": index}
+        consumed = 0
+
+
+def _pages(http: Http, fetch_page: Callable[[int, int], Dict], pagination_from: int, pagination_size: int,
+           next_link: Optional[str] = None) -> Iterator[Tuple[Dict, Dict]]:
+    # the pages with how to request them again
+    if next_link is not None:
+        origin, page = {"next": next_link}, http.get(next_link)
+    else:
+        origin, page = {"from": pagination_from}, fetch_page(pagination_from, pagination_size)
+    followed = next_link is not None
+    while page["_results"]:
+        yield origin, page
+        if "_next" in page:
+            followed = True
+            origin, page = {"next": page["_next"]}, http.get(page["_next"])
+            continue
+        # the last page of a listing paginated with _next links, from/size does not follow them
+        if followed:
+            return
+        pagination_from += len(page["_results"])
+        if len(page["_results"]) < pagination_size or pagination_from >= page.get("_total", float("inf")):
+            return
+        origin, page = {"from": pagination_from}, fetch_page(pagination_from, pagination_size)
+
+
+def _prefetch(pages: Iterator[Tuple[Dict, Dict]], max_pages: int) -> Iterator[Tuple[Dict, Dict]]:
+    # one slot per page in memory: the producer takes a slot before fetching a page,
+    # the consumer gives it back once it is done with the page
+    slots = threading.Semaphore(max_pages)
+    buffer = queue.Queue()
+    stop = threading.Event()
+    end = object()
+
+    def produce():
+        try:
+            while True:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                page = next(pages, end)
+                buffer.put(page)
+                if page is end:
+                    return
+        except Exception as e:
+            buffer.put(e)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            page = buffer.get()
+            if page is end:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+            slots.release()
+    finally:
+        stop.set()
+        slots.release()
@@ -0,0 +1,54 @@
+import collections
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+
+def parallel_map(function: Callable, iterable: Iterable, workers: int = 4, ordered: bool = True,
+                 window: Optional[int] = None) -> Iterator[Tuple[int, Any]]:
+    """
+        Apply a function to the items of an iterable with a bounded pool of threads.
+
+        The iterable is consumed lazily: at most `window` items are submitted and not yet yielded at any time,
+        so a generator of any size can be processed in constant memory.
+
+        :param function: function to call on each item
+        :param iterable: items to process, consumed lazily
+        :param workers: OPTIONAL number of threads (default: 4)
+        :param ordered: OPTIONAL if True, the results are yielded in input order, if False in completion order
+            (default: True)
+        :param window: OPTIONAL maximum number of items in flight (default: twice the number of workers)
+        :return: iterator of (index, result) tuples where index is the position of the item in the iterable and
+            result is either the value returned by the function or the exception it raised
+    """
+    window = window or 2 * workers
+    items = enumerate(iterable)
+    pending = collections.OrderedDict()  # future -> index, in submission order
+
+    def submit(executor) -> bool:
+        for index, item in items:
+            pending[executor.submit(function, item)] = index
+            return True
+        return False
+
+    def outcome(future):
+        error = future.exception()
+        return error if error is not None else future.result()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while len(pending) < window and submit(executor):
+                pass
+            while pending:
+                if ordered:
+                    future = next(iter(pending))
+                    done = [future]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    submit(executor)
+                    yield index, outcome(future)
+        finally:
+            # the consumer stopped early: do not start what has not been started yet
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,175 @@
+import asyncio
+import collections
+import contextlib
+import math
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+
+class RateLimiter:
+    """
+        Client-side limits of the rate of the requests (token bucket) and of the number of requests in flight.
+
+        Additional limits can be given per endpoint family, as computed by Http._endpoint_family: the name of the
+        sub-API (e.g. "resources", "files", "views"), followed by "/_search" or "/sparql" for the queries of views.
+        A request must then satisfy both the global limits and the limits of its family.
+
+        The limiter is thread-safe. It is shared by all the sub-APIs of a client, and can be shared by several clients.
+
+        Usage:
+            limiter = RateLimiter(rate=50, max_in_flight=16, families={"views/_search": RateLimiter(rate=5)})
+            nexus = NexusClient(environment, token, rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None, max_in_flight: Optional[int] = None,
+                 families: Optional[Dict[str, "RateLimiter"]] = None):
+        """
+            :param rate: OPTIONAL maximum number of requests per second on average (default: None, unlimited)
+            :param burst: OPTIONAL maximum number of requests sent at once after an idle period, i.e. the capacity of
+                the bucket (default: None, the rate rounded up)
+            :param max_in_flight: OPTIONAL maximum number of requests waiting for their response at the same time
+                (default: None, unlimited)
+            :param families: OPTIONAL additional limits by endpoint family (default: None)
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, math.ceil(rate or 1))
+        self.max_in_flight = max_in_flight
+        self.families = dict(families or {})
+        self._condition = threading.Condition()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        # coroutines waiting for a place in flight, as (event loop, future) pairs, woken one by one as places are freed
+        self._async_waiters = collections.deque()
+        self._stats = {"requests": 0, "throttled": 0, "throttled_seconds": 0.0}
+
+    @contextlib.contextmanager
+    def slot(self, family: Optional[str] = None) -> Iterator[None]:
+        """
+            Context manager waiting until a request of the given family can be sent, and holding its place in flight
+            until the end of the block.
+
+            :param family: OPTIONAL endpoint family of the request
+        """
+        limiters = self._limiters(family)
+        started = time.monotonic()
+        delay = max(limiter._reserve() for limiter in limiters)
+        if delay > 0:
+            time.sleep(delay)
+        entered = []
+        try:
+            for limiter in limiters:
+                limiter._enter()
+                entered.append(limiter)
+            self._record(time.monotonic() - started)
+            yield
+        finally:
+            for limiter in entered:
+                limiter._exit()
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self, family: Optional[str] = None):
+        """
+            Asynchronous counterpart of slot, which does not block the event loop while waiting.
+
+            :param family: OPTIONAL endpoint family of the request
+        """
+        limiters = self._limiters(family)
+        started = time.monotonic()
+        delay = max(limiter._reserve() for limiter in limiters)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        entered = []
+        try:
+            for limiter in limiters:
+                await limiter._async_enter()
+                entered.append(limiter)
+            self._record(time.monotonic() - started)
+            yield
+        finally:
+            for limiter in entered:
+                limiter._exit()
+
+    def stats(self) -> Dict:
+        """
+            :return: the counters since the creation of the limiter: the number of requests, of requests which had to
+                wait ("throttled") and the total time in seconds they waited
+        """
+        with self._condition:
+            return dict(self._stats)
+
+    def _limiters(self, family: Optional[str]) -> List["RateLimiter"]:
+        # the limits of the family are taken first, so a request waiting for its family does not hold a global place
+        specific = self.families.get(family)
+        return [specific, self] if specific is not None else [self]
+
+    def _reserve(self) -> float:
+        """
+            Takes a token from the bucket, in advance if it is empty, and returns the delay before it is available.
+        """
+        if self.rate is None:
+            return 0.0
+        with self._condition:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _enter(self) -> None:
+        with self._condition:
+            while self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def _async_enter(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                if self.max_in_flight is None or self._in_flight < self.max_in_flight:
+                    self._in_flight += 1
+                    return
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                with self._condition:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                    else:
+                        # it was woken for a place it will not take: the place goes to the next waiter
+                        self._wake_async_waiter()
+                raise
+
+    def _exit(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            # a thread and a coroutine may both be woken, the one which does not get the place waits again
+            self._condition.notify()
+            self._wake_async_waiter()
+
+    def _wake_async_waiter(self) -> None:
+        # called with the condition held, the future is resolved in the thread of its event loop
+        while self._async_waiters:
+            loop, future = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_resolve, future)
+                return
+            except RuntimeError:
+                # the event loop is closed
+                continue
+
+    def _record(self, waited: float) -> None:
+        with self._condition:
+            self._stats["requests"] += 1
+            # below a millisecond, the request did not actually wait
+            if waited > 0.001:
+                self._stats["throttled"] += 1
+                self._stats["throttled_seconds"] += waited
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
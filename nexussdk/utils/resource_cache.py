@@ -0,0 +1,232 @@
+import collections
+import datetime
+import json
+import threading
+import time
+from typing import Dict, Hashable, Iterable, Iterator, Optional
+
+
+class ResourceCache:
+    """
+        In-memory cache of the payloads of the resources fetched with Resources.fetch, bounded by number of entries
+        and by size (least recently used entries are evicted first).
+
+        A revision of a resource never changes, so the fetches pinned to a revision or a tag are cached for good. The
+        fetches of the latest revision are only cached while the cache watches the events of the resources (see
+        Resources.watch): the event of a change of a resource invalidates them. The updates, deprecations and tags made
+        through the same Resources invalidate them too. As a stream of events starts by replaying the past ones, they
+        are only cached once the cache has caught up with the stream: when it receives an event which is recent, or
+        when no event comes for catch_up_delay seconds.
+
+        The payloads are stored serialized, each hit returns a new copy that the caller can modify.
+
+        Usage:
+            nexus = NexusClient(environment, token, resource_cache=ResourceCache(max_entries=50000))
+            nexus.resources.watch(org_label, project_label)
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 ** 2, immutable_tags: bool = True,
+                 catch_up_delay: float = 2.0):
+        """
+            :param max_entries: OPTIONAL maximum number of payloads kept (default: 10000)
+            :param max_bytes: OPTIONAL maximum size in bytes of the serialized payloads kept (default: 64 MiB)
+            :param immutable_tags: OPTIONAL set to False if tags are moved to other revisions in the deployment, the
+                fetches of a tag are then cached and invalidated like the ones of the latest revision (default: True)
+            :param catch_up_delay: OPTIONAL age in seconds under which an event is recent, and time in seconds without
+                event after which the cache has caught up with the stream of events (default: 2)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.immutable_tags = immutable_tags
+        self.catch_up_delay = catch_up_delay
+        self._lock = threading.Lock()
+        # by key: (serialized payload, ids of the resource, True if immutable)
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        # keys of the entries which are not immutable, by id of their resource
+        self._mutable = collections.defaultdict(set)
+        # latest invalidations, to detect the ones which happened while a payload was being fetched
+        self._epoch = 0
+        self._invalidations = collections.deque(maxlen=10000)
+        self._watcher = None
+        # set once the watcher has consumed the past events, with the time of the last event received until then
+        self._caught_up = False
+        self._last_event = 0.0
+        self._stats = dict.fromkeys(("hits", "misses", "invalidations"), 0)
+
+    @property
+    def watching(self) -> bool:
+        """
+            True while the cache is invalidated by a stream of events it has caught up with.
+        """
+        if self._watcher is None:
+            return False
+        if not self._caught_up and time.monotonic() - self._last_event >= self.catch_up_delay:
+            self._caught_up = True
+        return self._caught_up
+
+    @property
+    def epoch(self) -> int:
+        """
+            Counter of the invalidations, to take before fetching a payload to put.
+        """
+        return self._epoch
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """
+            :param key: identity of the fetch
+            :return: a copy of the cached payload, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+        return json.loads(entry[0])
+
+    def put(self, key: Hashable, payload: Dict, ids: Iterable[str], immutable: bool, epoch: int) -> None:
+        """
+            Caches a payload, unless it may have been invalidated while it was fetched.
+
+            :param key: identity of the fetch
+            :param payload: payload of the resource
+            :param ids: ids of the resource, as given in the events and in the fetch
+            :param immutable: True if the fetch was pinned to a version which never changes
+            :param epoch: value of epoch taken before the fetch
+        """
+        ids = tuple(i for i in set(ids) if i)
+        content = json.dumps(payload).encode("utf-8")
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if not immutable:
+                if not self.watching or self._invalidated_since(epoch, ids):
+                    return
+                for i in ids:
+                    self._mutable[i].add(key)
+            self._discard(key)
+            self._entries[key] = (content, ids, immutable)
+            self._size += len(content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(self, resource_id: str) -> None:
+        """
+            Removes the payloads of a resource which are not immutable.
+
+            :param resource_id: id of the resource
+        """
+        with self._lock:
+            self._epoch += 1
+            self._invalidations.append((self._epoch, resource_id))
+            self._stats["invalidations"] += 1
+            for key in list(self._mutable.pop(resource_id, ())):
+                self._discard(key)
+
+    def watch(self, events: Iterator) -> threading.Thread:
+        """
+            Starts consuming a stream of events in a background thread to invalidate the cache.
+
+            :param events: server-sent events of the resources, e.g. Resources.project_events
+            :return: the thread consuming the events
+        """
+        with self._lock:
+            if self._watcher is not None:
+                raise RuntimeError("The cache is already watching events, stop it first.")
+            stop = threading.Event()
+            thread = threading.Thread(target=self._consume, args=(events, stop), name="nexussdk-resource-cache",
+                                      daemon=True)
+            self._watcher = (thread, stop, events)
+            self._caught_up = False
+            self._last_event = time.monotonic()
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """
+            Stops watching the events. As the cache is not invalidated anymore, the payloads which are not immutable are
+            removed. The stream of events is closed if it can be, which ends the thread, otherwise the thread stops at
+            the next event it receives.
+        """
+        with self._lock:
+            if self._watcher is None:
+                return
+            _, stop, events = self._watcher
+            stop.set()
+            self._watcher = None
+            self._discard_mutable()
+        close = getattr(events, "close", None)
+        if close is not None:
+            close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._size}
+
+    def _consume(self, events: Iterator, stop: threading.Event) -> None:
+        try:
+            for event in events:
+                if stop.is_set():
+                    return
+                try:
+                    data = json.loads(event.data) if event.data else {}
+                except ValueError:
+                    continue
+                if not isinstance(data, dict):
+                    continue
+                if data.get("_resourceId"):
+                    self.invalidate(data["_resourceId"])
+                if not self._caught_up:
+                    self._last_event = time.monotonic()
+                    if self._is_recent(data.get("_instant")):
+                        self._caught_up = True
+        finally:
+            with self._lock:
+                # the stream ended: the cache cannot be kept consistent anymore
+                if self._watcher is not None and self._watcher[1] is stop:
+                    self._watcher = None
+                    self._discard_mutable()
+
+    def _is_recent(self, instant: Optional[str]) -> bool:
+        if not isinstance(instant, str):
+            return False
+        try:
+            # fromisoformat accepts neither the Z suffix nor more than 6 decimals before Python 3.11
+            date, _, fraction = instant.replace("Z", "+00:00").partition(".")
+            if fraction:
+                digits = len(fraction) - len(fraction.lstrip("0123456789"))
+                date += "." + fraction[:min(digits, 6)].ljust(6, "0") + fraction[digits:]
+            moment = datetime.datetime.fromisoformat(date)
+        except ValueError:
+            return False
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=datetime.timezone.utc)
+        age = datetime.datetime.now(datetime.timezone.utc) - moment
+        return age.total_seconds() < self.catch_up_delay
+
+    def _invalidated_since(self, epoch: int, ids: Iterable[str]) -> bool:
+        if self._epoch == epoch:
+            return False
+        if not self._invalidations or self._invalidations[0][0] > epoch + 1:
+            # some of the invalidations since the epoch are not remembered anymore
+            return True
+        return any(e > epoch and i in ids for e, i in self._invalidations)
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= len(entry[0])
+        if not entry[2]:
+            for i in entry[1]:
+                keys = self._mutable.get(i)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._mutable[i]
+
+    def _discard_mutable(self) -> None:
+        for key in [k for k, entry in self._entries.items() if not entry[2]]:
+            self._discard(key)
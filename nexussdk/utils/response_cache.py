@@ -0,0 +1,167 @@
+import collections
+import hashlib
+import json
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import parse_qsl, urlparse
+
+from nexussdk.utils.file_cache import FileCache
+
+
+class CachedResponse:
+    """
+        Body of a JSON response with the validators to check if it is still current with a conditional request.
+    """
+
+    __slots__ = ("content", "etag", "last_modified", "immutable")
+
+    def __init__(self, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None,
+                 immutable: bool = False):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.immutable = immutable
+
+    def validators(self) -> Dict[str, str]:
+        """
+            :return: the headers making a request conditional on the response having changed
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+        Cache of the JSON responses of the GET requests of Http, in memory (LRU bounded in bytes) and optionally on
+        disk.
+
+        A response to a request pinned to a revision or a tag (e.g. Resources.fetch with rev or tag) is immutable: it is
+        served from the cache without any request. Another response is stored with its validators (ETag,
+        Last-Modified) and the request is sent again with them: if the server answers 304 Not Modified, the cached
+        response is used and its body is not transferred again. Responses without validators are not cached.
+
+        The cache is thread-safe. It can be shared by several clients, the responses are kept apart by token.
+
+        Usage:
+            nexus = NexusClient(environment, token, response_cache=ResponseCache(max_bytes=128 * 1024 ** 2))
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 ** 2, directory: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None, pinned_params: Iterable[str] = ("rev", "tag")):
+        """
+            :param max_bytes: OPTIONAL maximum size in bytes of the responses kept in memory (default: 64 MiB)
+            :param directory: OPTIONAL directory where the responses are also stored, to be kept across runs
+                (default: None, only in memory)
+            :param max_disk_bytes: OPTIONAL maximum size in bytes of the responses stored on disk (default: None,
+                unbounded)
+            :param pinned_params: OPTIONAL query parameters pinning a request to an immutable version. Remove "tag"
+                if tags are moved to other revisions in the deployment (default: "rev", "tag")
+        """
+        self.max_bytes = max_bytes
+        self.pinned_params = frozenset(pinned_params)
+        self._disk = FileCache(directory, max_disk_bytes) if directory is not None else None
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._stats = dict.fromkeys(("hits", "revalidated", "misses"), 0)
+
+    def key(self, url: str, params: Optional[Dict], accept: Optional[str], token: Optional[str]) -> str:
+        """
+            :return: the key of the response to a GET request
+        """
+        query = sorted(self._query(url, params).items())
+        parts = [url.split("?")[0], query, accept, hashlib.sha256((token or "").encode("utf-8")).hexdigest()]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+    def is_pinned(self, url: str, params: Optional[Dict]) -> bool:
+        """
+            :return: True if the request is pinned to a revision or a tag
+        """
+        return not self.pinned_params.isdisjoint(self._query(url, params))
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+            :param key: key of the response, see key
+            :return: the cached response, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self._disk is None:
+            return None
+        filepath = self._disk.get("response", key)
+        if filepath is None:
+            return None
+        try:
+            with open(filepath, "rb") as f:
+                metadata = json.loads(f.readline())
+                entry = CachedResponse(f.read(), metadata["etag"], metadata["last_modified"], metadata["immutable"])
+        except (OSError, ValueError, KeyError):
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """
+            :param key: key of the response, see key
+            :param entry: response to cache
+        """
+        self._remember(key, entry)
+        if self._disk is not None:
+            metadata = {"etag": entry.etag, "last_modified": entry.last_modified, "immutable": entry.immutable}
+
+            def write(filepath: str) -> None:
+                with open(filepath, "wb") as f:
+                    f.write(json.dumps(metadata).encode("utf-8") + b"\n")
+                    f.write(entry.content)
+
+            self._disk.put("response", key, write)
+
+    def count(self, outcome: str) -> None:
+        """
+            Counts the outcome of a lookup: "hits" (served from the cache), "revalidated" (304 Not Modified) or
+            "misses".
+        """
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def stats(self) -> Dict:
+        """
+            :return: the number of responses served from the cache, revalidated and missed, and the number and size
+                of the responses in memory
+        """
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._size}
+
+    def clear(self) -> None:
+        """
+            Forgets the responses kept in memory.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    @staticmethod
+    def _query(url: str, params: Optional[Dict]) -> Dict[str, str]:
+        query = dict(parse_qsl(urlparse(url).query))
+        query.update((k, str(v)) for k, v in (params or {}).items() if v is not None)
+        return query
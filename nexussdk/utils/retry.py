@@ -0,0 +1,135 @@
+import email.utils
+import random
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+class RetryPolicy:
+    """
+        When and how long to wait before sending again a request which failed transiently, i.e. with a connection
+        error, a timeout or one of the given status codes.
+
+        The delays grow exponentially with the attempts and are randomized ("full jitter"), so the clients which failed
+        together do not retry together. A delay requested by the server with a Retry-After header is respected.
+
+        The writes of Nexus are conditional (on the revision to update, or on the id of the resource to create not being
+        taken yet): a retry of a write which was processed although it failed would fail with a 409 Conflict. So the
+        conditional methods are only retried when the request was certainly not processed: when the connection could
+        not be established, or when the server answered 429 or 503.
+
+        The policy keeps counters of the retries, so their cost can be monitored. It is thread-safe and can be shared.
+
+        Usage:
+            retry = RetryPolicy(total=5, max_elapsed=300)
+            nexus = NexusClient(environment, token, retry=retry)
+            ...
+            print(retry.stats())
+    """
+
+    # status codes of the responses to requests which were not processed
+    unprocessed_status_codes = frozenset((429, 503))
+
+    def __init__(self, total: int = 3, status_codes: Iterable[int] = (429, 502, 503, 504),
+                 methods: Optional[Iterable[str]] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+                 conditional_methods: Iterable[str] = ("PUT", "DELETE"), backoff_factor: float = 0.5,
+                 backoff_max: float = 30.0, max_elapsed: Optional[float] = 120.0, respect_retry_after: bool = True):
+        """
+            :param total: OPTIONAL maximum number of retries of a request, 0 to disable the retries (default: 3)
+            :param status_codes: OPTIONAL status codes of the responses to retry (default: 429, 502, 503, 504)
+            :param methods: OPTIONAL verbs of the requests to retry, None for all of them. POST and PATCH are not
+                idempotent and are not retried by default, as the failed request might have been processed
+                (default: GET, HEAD, OPTIONS, PUT, DELETE)
+            :param conditional_methods: OPTIONAL verbs among the retried ones which are only retried when the request
+                was certainly not processed (default: PUT, DELETE)
+            :param backoff_factor: OPTIONAL the delay before the nth retry is drawn between 0 and
+                backoff_factor * 2 ** (n - 1) seconds (default: 0.5)
+            :param backoff_max: OPTIONAL maximum delay in seconds before a retry (default: 30)
+            :param max_elapsed: OPTIONAL time in seconds after which a request is not retried anymore, counted from
+                its first attempt, None for no limit (default: 120)
+            :param respect_retry_after: OPTIONAL if True, wait the delay given by the Retry-After header of a response
+                instead of the computed one (default: True)
+        """
+        self.total = total
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(m.upper() for m in methods) if methods is not None else None
+        self.conditional_methods = frozenset(m.upper() for m in conditional_methods)
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.max_elapsed = max_elapsed
+        self.respect_retry_after = respect_retry_after
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("requests", "retried_requests", "retries", "exhausted"), 0)
+        self._stats["retry_seconds"] = 0.0
+
+    def delay(self, method: str, retries: int, elapsed: float, status: Optional[int] = None,
+              retry_after: Optional[str] = None, sent: bool = True) -> Optional[float]:
+        """
+            :param method: verb of the request
+            :param retries: number of times the request has already been retried
+            :param elapsed: time in seconds since the first attempt of the request
+            :param status: OPTIONAL status code of the response, None if the request failed without a response
+            :param retry_after: OPTIONAL value of the Retry-After header of the response
+            :param sent: OPTIONAL False if the request failed without a response before it could be sent, i.e. the
+                connection could not be established (default: True)
+            :return: the delay in seconds to wait before retrying the request, or None if it must not be retried
+        """
+        if status is not None and status not in self.status_codes:
+            return None
+        if retries >= self.total or (self.methods is not None and method.upper() not in self.methods):
+            return None
+        if method.upper() in self.conditional_methods and \
+                (status not in self.unprocessed_status_codes if status is not None else sent):
+            return None
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_factor * 2 ** retries))
+        if status is not None and retry_after and self.respect_retry_after:
+            requested = _parse_retry_after(retry_after)
+            if requested is not None:
+                delay = requested
+        if self.max_elapsed is not None and elapsed + delay > self.max_elapsed:
+            return None
+        return delay
+
+    def record(self, retries: int, retry_seconds: float, succeeded: bool) -> None:
+        """
+            Counts a request once it is completed.
+
+            :param retries: number of times the request has been retried
+            :param retry_seconds: time in seconds spent by the retries (waits and attempts after the first one)
+            :param succeeded: False if the request failed after its retries
+        """
+        with self._lock:
+            self._stats["requests"] += 1
+            if retries:
+                self._stats["retried_requests"] += 1
+                self._stats["retries"] += retries
+                self._stats["retry_seconds"] += retry_seconds
+                if not succeeded:
+                    self._stats["exhausted"] += 1
+
+    def stats(self) -> Dict:
+        """
+            :return: the counters since the creation of the policy or the last reset: the number of requests, of
+                retried requests, of retries, of requests which failed after their retries ("exhausted") and the time
+                spent in seconds by the retries
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = type(self._stats[key])()
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    # either a number of seconds or an HTTP date
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
@@ -0,0 +1,110 @@
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """
+        Deduplication of identical calls in flight at the same time: the first call (the leader) is executed, the
+        identical calls made while it is in flight (the followers) wait for it and receive a deep copy of its result,
+        or its exception. The calls made once it is completed are executed again.
+
+        Each caller owns the object it receives, so modifying it does not affect the other callers.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._futures = {}
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+            Executes the function, unless an identical call is in flight in another thread.
+
+            :param key: identity of the call
+            :param function: the call to execute
+            :return: the result of the call
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self._stats["coalesced"] += 1
+                call.followers += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.snapshot)
+        try:
+            result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            with self._lock:
+                del self._calls[key]
+            # copied before the leader gets the result, which it could modify while the followers copy it
+            if call.followers:
+                call.snapshot = copy.deepcopy(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    async def do_async(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """
+            Asynchronous counterpart of do, for the calls made from the same event loop.
+
+            :param key: identity of the call
+            :param function: function returning the call to await
+            :return: the result of the call
+        """
+        call = self._futures.get(key)
+        with self._lock:
+            self._stats["calls"] += 1
+            if call is not None:
+                self._stats["coalesced"] += 1
+        if call is not None:
+            call.followers += 1
+            return copy.deepcopy(await asyncio.shield(call.future))
+        call = self._futures[key] = _Call(asyncio.get_running_loop().create_future())
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            call.future.cancel()
+            raise
+        except BaseException as e:
+            call.future.set_exception(e)
+            # marks the exception as retrieved, there may be no follower to do it
+            call.future.exception()
+            raise
+        else:
+            # copied before the leader gets the result, which it could modify before the followers copy it
+            call.future.set_result(copy.deepcopy(result) if call.followers else None)
+            return result
+        finally:
+            del self._futures[key]
+
+    def stats(self) -> Dict:
+        """
+            :return: the number of calls and of calls which were served by an identical call in flight
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+class _Call:
+
+    def __init__(self, future: Optional[asyncio.Future] = None):
+        self.done = threading.Event()
+        self.future = future
+        self.followers = 0
+        self.snapshot = None
+        self.error = None
@@ -6,10 +6,11 @@ For more details see `Nexus KG views documentation <https://bluebrainnexus.io/do
 """
 
 import json
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, Iterator, List, Optional, Set, Union
 from urllib.parse import quote_plus as url_encode
 
 from nexussdk.utils.http import Http
+from nexussdk.utils.pagination import iter_results
 
 
 class Views:
@@ -192,6 +193,25 @@ class Views:
 
         return self._http.get(path, use_base=True, params=params)
 
+    def iter_list(self, org_label, project_label, pagination_from=0, pagination_size=20, deprecated=None, type=None,
+                  rev=None, schema=None, created_by=None, updated_by=None, view_id=None, max_pages=1):
+        """
+        Iterate over the views available for a given organization and project, fetching the pages lazily.
+        See `list` for the filtering arguments.
+
+        :param pagination_from: OPTIONAL The pagination index to start from (default: 0)
+        :param pagination_size: OPTIONAL The number of views fetched per page (default: 20)
+        :param max_pages: OPTIONAL maximum number of pages held in memory. If greater than 1, the next pages are
+            fetched in the background while the current one is consumed (default: 1)
+        :return: iterator of the listed views
+        """
+
+        def fetch_page(page_from, page_size):
+            return self.list(org_label, project_label, page_from, page_size, deprecated, type, rev, schema,
+                             created_by, updated_by, view_id)
+
+        return iter_results(self._http, fetch_page, pagination_from, pagination_size, max_pages)
+
     def tag_es(self, esview, tag_value, rev_to_tag=None, rev=None):
         """
         Add a tag to a a specific revision of an ElasticSearch view. Note that a new revision (untagged) will be created.
@@ -299,6 +319,28 @@ class Views:
 
         return self._http.post(path, body=query, use_base=True)
 
+    def iter_query_es(self, org_label: str, project_label: str, query: Union[str, Dict],
+                      view_id: str = "nxv:defaultElasticSearchIndex") -> Iterator[Dict]:
+        """
+        Perform a ElasticSearch query and iterate over its hits while the response is received, so that large
+        results are never held in memory at once.
+
+        :param org_label: Label of the organization to perform the query on
+        :param project_label: Label of the project to perform the query on
+        :param view_id: id of an ElasticSearch view
+        :param query: ElasticSearch query as a JSON string or a dictionary
+        :return: iterator of the hits of the query (i.e. the elements of hits.hits)
+        """
+        path = "/views/" + url_encode(org_label) + "/" + url_encode(project_label) + "/" + url_encode(view_id) \
+               + "/_search"
+
+        self._http.require_sync("Views.iter_query_es")
+
+        if (not isinstance(query, dict)) and isinstance(query, str):
+            query = json.loads(query)
+
+        return self._http.post(path, body=query, use_base=True, items_path="hits.hits")
+
     def create_sparql(self, org_label: str, project_label: str, view_id: Optional[str] = None,
                       resource_schemas: Optional[Set[str]] = None,
                       resource_types: Optional[Set[str]] = None,
@@ -19,13 +19,15 @@ setup(
     url="https://github.com/BlueBrain/nexus-python-sdk",
     license="Apache License, Version 2.0",
     packages=find_packages(),
-    python_requires=">=3.5",
+    python_requires=">=3.7",
     install_requires=[
         "puremagic",
         "requests",
         "sseclient"
     ],
     extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
         "test": ["pytest", "pytest-cov"],
         "doc": ["sphinx"],
     },
@@ -40,8 +42,6 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Operating System :: MacOS",
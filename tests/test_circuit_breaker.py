@@ -0,0 +1,98 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests import HTTPError
+
+from nexussdk.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from nexussdk.utils.http import Http
+from nexussdk.utils.metrics import MetricsRegistry
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for _ in range(2):
+            breaker.after("resources", True, breaker.before("resources"))
+        # a success resets the count of consecutive failures
+        breaker.after("resources", False, breaker.before("resources"))
+        for _ in range(2):
+            breaker.after("resources", True, breaker.before("resources"))
+        self.assertEqual(breaker.state("resources"), "closed")
+        breaker.after("resources", True, breaker.before("resources"))
+        self.assertEqual(breaker.state("resources"), "open")
+        with self.assertRaises(CircuitOpenError) as raised:
+            breaker.before("resources")
+        self.assertGreater(raised.exception.retry_in, 59)
+        # the other families are not affected
+        self.assertFalse(breaker.before("files"))
+
+    def test_half_open_probes(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, half_open_probes=2)
+        breaker.after("views", True, breaker.before("views"))
+        self.assertEqual(breaker.state("views"), "open")
+        time.sleep(0.06)
+        self.assertEqual(breaker.state("views"), "half-open")
+        probes = [breaker.before("views"), breaker.before("views")]
+        self.assertEqual(probes, [True, True])
+        # all the probes are in flight
+        with self.assertRaises(CircuitOpenError):
+            breaker.before("views")
+        breaker.after("views", False, True)
+        self.assertEqual(breaker.state("views"), "half-open")
+        breaker.after("views", False, True)
+        self.assertEqual(breaker.state("views"), "closed")
+
+    def test_failed_probe_opens_again(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.after("views", True, breaker.before("views"))
+        time.sleep(0.06)
+        breaker.after("views", True, breaker.before("views"))
+        self.assertEqual(breaker.state("views"), "open")
+        self.assertEqual(breaker.stats()["views"]["opened"], 2)
+
+    def test_is_failure(self):
+        breaker = CircuitBreaker()
+        self.assertTrue(breaker.is_failure(None))
+        self.assertTrue(breaker.is_failure(503))
+        self.assertFalse(breaker.is_failure(404))
+
+
+class _Unavailable(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHttpCircuitBreaker(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Unavailable)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.http = Http("http://127.0.0.1:%d/v1" % self.server.server_port, retry=0,
+                         circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_rejected_requests_are_measured(self):
+        events = []
+        metrics = MetricsRegistry()
+        self.http.add_hook(events.append)
+        self.http.add_hook(metrics.observe)
+        for _ in range(2):
+            with self.assertRaises(HTTPError):
+                self.http.get(["resources", "o", "p", "x"])
+        with self.assertRaises(CircuitOpenError):
+            self.http.get(["resources", "o", "p", "x"])
+        self.assertEqual([(e.status, e.error) for e in events], [(503, None), (503, None), (None, "CircuitOpenError")])
+        self.assertEqual(metrics._errors[("resources", "GET")], 3)
+        self.assertEqual(self.http.retry.stats()["requests"], 3)
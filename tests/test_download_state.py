@@ -0,0 +1,118 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from nexussdk.files import FileContent, _DownloadState
+from nexussdk.utils.http import Http
+
+DATA = os.urandom(10 * 1024 + 5)
+METADATA = {"_self": "http://nexus/v1/files/o/p/f", "_rev": 3, "_bytes": len(DATA),
+            "_digest": {"_algorithm": "SHA-256", "_value": hashlib.sha256(DATA).hexdigest()}}
+
+
+class TestDownloadState(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.directory.name, "f.bin")
+        with open(self.out, "wb") as f:
+            f.truncate(len(DATA))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_resume_same_file(self):
+        state = _DownloadState(self.out, METADATA, 1024)
+        state.add((0, 1023))
+        state.add((2048, 3071))
+        resumed = _DownloadState(self.out, METADATA, 4096)
+        # the part size of the interrupted download is kept, so the recorded ranges match
+        self.assertEqual(resumed.part_size, 1024)
+        self.assertEqual(resumed.completed, {(0, 1023), (2048, 3071)})
+
+    def test_other_revision_restarts(self):
+        _DownloadState(self.out, METADATA, 1024).add((0, 1023))
+        for changed in ({"_rev": 4}, {"_digest": {"_value": "00"}}, {"_self": "http://nexus/v1/files/o/p/g"}):
+            resumed = _DownloadState(self.out, {**METADATA, **changed}, 4096)
+            self.assertEqual(resumed.completed, set())
+            self.assertEqual(resumed.part_size, 4096)
+            _DownloadState(self.out, METADATA, 1024).add((0, 1023))
+
+    def test_output_file_changed(self):
+        _DownloadState(self.out, METADATA, 1024).add((0, 1023))
+        with open(self.out, "r+b") as f:
+            f.truncate(10)
+        self.assertEqual(_DownloadState(self.out, METADATA, 1024).completed, set())
+
+    def test_corrupt_sidecar(self):
+        with open(self.out + _DownloadState.suffix, "w") as f:
+            f.write('{"file": ')
+        self.assertEqual(_DownloadState(self.out, METADATA, 1024).completed, set())
+
+    def test_remove(self):
+        state = _DownloadState(self.out, METADATA, 1024)
+        self.assertTrue(os.path.exists(self.out + _DownloadState.suffix))
+        state.remove()
+        self.assertFalse(os.path.exists(self.out + _DownloadState.suffix))
+        state.remove()
+
+
+class _Ranges(BaseHTTPRequestHandler):
+    requested = []
+    fail_from = None
+
+    def do_GET(self):
+        start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", self.headers["Range"]).groups())
+        end = min(end, len(DATA) - 1)
+        _Ranges.requested.append((start, end))
+        if _Ranges.fail_from is not None and start >= _Ranges.fail_from:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = DATA[start:end + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", "bytes %d-%d/%d" % (start, end, len(DATA)))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestResumableSave(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Ranges)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.http = Http("http://127.0.0.1:%d/v1" % self.server.server_port, retry=0)
+        self.directory = tempfile.TemporaryDirectory()
+        self.out = os.path.join(self.directory.name, "f.bin")
+        _Ranges.requested, _Ranges.fail_from = [], None
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def content(self):
+        return FileContent(self.http, ["files", "o", "p", "f"], metadata=METADATA)
+
+    def test_resume_interrupted_download(self):
+        _Ranges.fail_from = 6 * 1024
+        with self.assertRaises(Exception):
+            self.content().save(self.out, workers=1, part_size=1024, resume=True)
+        self.assertTrue(os.path.exists(self.out + _DownloadState.suffix))
+        _Ranges.requested, _Ranges.fail_from = [], None
+        self.content().save(self.out, workers=3, part_size=4096, resume=True)
+        with open(self.out, "rb") as f:
+            self.assertEqual(f.read(), DATA)
+        self.assertFalse(os.path.exists(self.out + _DownloadState.suffix))
+        # only the missing ranges are downloaded again, with the part size of the interrupted download
+        self.assertEqual(sorted(_Ranges.requested), [(start, min(start + 1023, len(DATA) - 1))
+                                                     for start in range(6 * 1024, len(DATA), 1024)])
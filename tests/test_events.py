@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from nexussdk.utils import http
+from nexussdk.utils.http import Http
+
+
+class _Events(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # seconds between two events after the first one, None to send a single event and stay idle
+    interval = None
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        try:
+            index = 0
+            while True:
+                self.wfile.write(b"id: %d\ndata: {\"index\": %d}\n\n" % (index, index))
+                self.wfile.flush()
+                index += 1
+                time.sleep(self.interval if self.interval is not None else 30)
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestEventStream(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Events)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.http = Http("http://127.0.0.1:%d/v1" % self.server.server_port)
+        _Events.interval = None
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def consume(self, events):
+        received = []
+        thread = threading.Thread(target=lambda: received.extend(events), daemon=True)
+        thread.start()
+        while not received:
+            time.sleep(0.01)
+        return thread, received
+
+    def test_close_ends_a_blocked_iteration(self):
+        events = self.http.sse_request("/resources/events", None)
+        thread, received = self.consume(events)
+        # the thread is waiting for an event which does not come
+        time.sleep(0.2)
+        self.assertTrue(thread.is_alive())
+        started = time.monotonic()
+        events.close()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual([e.data for e in received], ['{"index": 0}'])
+
+    def test_close_without_reaching_the_socket(self):
+        _Events.interval = 0.2
+        events = self.http.sse_request("/resources/events", None)
+        thread, _ = self.consume(events)
+        with mock.patch.object(http, "_shutdown_socket", return_value=False):
+            started = time.monotonic()
+            events.close()
+            # the caller does not wait, the iteration ends with the next event
+            self.assertLess(time.monotonic() - started, 0.1)
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+    def test_close_before_iterating(self):
+        events = self.http.sse_request("/resources/events", None)
+        events.close()
+        self.assertEqual(list(events), [])
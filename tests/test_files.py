@@ -1,4 +1,7 @@
 import filecmp
+import os
+import shutil
+import tempfile
 import time
 import unittest
 
@@ -41,3 +44,14 @@ class TestResources(unittest.TestCase):
         payload = self.nexus.files.list(self.org, self.prj)
         pretty_print(payload)
         self.assertGreater(len(payload["_results"]), 0)
+
+    def test_upload_tree(self):
+        local_dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(local_dir, "sub"))
+        shutil.copy("tests/an_attachment.txt", local_dir)
+        shutil.copy("tests/an_attachment_image.jpg", os.path.join(local_dir, "sub"))
+        manifest = self.nexus.files.upload_tree(self.org, self.prj, local_dir, workers=2)
+        pretty_print(manifest)
+        self.assertEqual(len(manifest), 2)
+        for entry in manifest.values():
+            self.assertEqual(entry["_rev"], 1)
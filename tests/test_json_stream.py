@@ -0,0 +1,68 @@
+import json
+import random
+import unittest
+
+from nexussdk.utils.json_stream import iter_json_array
+
+
+def chunked(document: bytes, size: int):
+    return [document[i:i + size] for i in range(0, len(document), size)]
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    kinds = ["int", "float", "exp", "string", "literal"] + (["list", "dict"] if depth < 3 else [])
+    kind = rng.choice(kinds)
+    if kind == "int":
+        return rng.randint(-10 ** 12, 10 ** 12)
+    if kind == "float":
+        return rng.uniform(-1000, 1000)
+    if kind == "exp":
+        return float("%de%d" % (rng.randint(-99, 99), rng.randint(-20, 20)))
+    if kind == "string":
+        return "".join(rng.choice("ab\"\\é\u2603 ,:]}") for _ in range(rng.randint(0, 8)))
+    if kind == "literal":
+        return rng.choice([True, False, None])
+    if kind == "list":
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {"k%d" % i: random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+class TestIterJsonArray(unittest.TestCase):
+
+    documents = [
+        {"_results": [0.5, 2e3, -1.25e-2, 10, 0, -7]},
+        {"_total": 12.5, "_links": {"a": [1, 2.5]}, "_results": [{"_score": 1.2345, "@id": "x"}, "é", None]},
+        {"hits": {"total": {"value": 3.0}, "max_score": 0.75, "hits": [{"_score": 0.75}, {"_score": 1e-7}]}},
+        {"_results": []},
+    ]
+
+    def test_every_chunk_size(self):
+        for payload in self.documents:
+            path = "hits.hits" if "hits" in payload else "_results"
+            expected = payload["hits"]["hits"] if "hits" in payload else payload["_results"]
+            document = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            for size in range(1, len(document) + 1):
+                actual = list(iter_json_array(chunked(document, size), path))
+                self.assertEqual(actual, expected, "chunks of %d bytes" % size)
+
+    def test_random_documents(self):
+        rng = random.Random(13)
+        for _ in range(1000):
+            payload = {"k%d" % i: random_value(rng) for i in range(rng.randint(0, 3))}
+            payload["nested"] = {"before": random_value(rng), "items": [random_value(rng) for _ in range(5)]}
+            document = json.dumps(payload, ensure_ascii=rng.random() < 0.5).encode("utf-8")
+            reparsed = json.loads(document)
+            chunks, start = [], 0
+            while start < len(document):
+                size = rng.randint(1, 20)
+                chunks.append(document[start:start + size])
+                start += size
+            self.assertEqual(list(iter_json_array(chunks, "nested.items")), reparsed["nested"]["items"])
+
+    def test_missing_path(self):
+        self.assertEqual(list(iter_json_array([b'{"a": 1.5, "b": {"c": 2}}'], "b.d")), [])
+        self.assertEqual(list(iter_json_array([b'{"a": 1.5}'], "_results")), [])
+
+    def test_truncated_document(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array([b'{"_results": [1, 2'], "_results"))
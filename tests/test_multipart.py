@@ -0,0 +1,84 @@
+import hashlib
+import io
+import os
+import tempfile
+import unittest
+from email.parser import BytesParser
+from email.policy import HTTP
+
+from nexussdk.utils.multipart import MultipartFile
+
+
+class TestMultipartFile(unittest.TestCase):
+
+    def setUp(self):
+        self.data = os.urandom(100 * 1024 + 7)
+        handle, self.filepath = tempfile.mkstemp()
+        with os.fdopen(handle, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        os.remove(self.filepath)
+
+    def body(self, filename="data.bin"):
+        return MultipartFile(self.filepath, filename, "application/octet-stream")
+
+    def test_form_data(self):
+        with self.body('a "quoted"\nname.bin') as body:
+            content = body.read()
+            self.assertEqual(len(content), len(body))
+            message = BytesParser(policy=HTTP).parsebytes(b"Content-Type: " + body.content_type.encode() + b"\r\n\r\n"
+                                                          + content)
+        parts = list(message.iter_parts())
+        self.assertEqual(len(parts), 1)
+        self.assertEqual(parts[0].get_param("name", header="content-disposition"), "file")
+        self.assertEqual(parts[0].get_filename(), "a %22quoted%22%0Aname.bin")
+        self.assertEqual(parts[0].get_content_type(), "application/octet-stream")
+        self.assertEqual(parts[0].get_payload(decode=True), self.data)
+
+    def test_read_by_chunks(self):
+        with self.body() as whole:
+            expected = whole.read().replace(boundary(whole), b"BOUNDARY")
+        for size in (1, 7, 1000, 64 * 1024, 10 ** 7):
+            with self.body() as body:
+                content = b"".join(iter(lambda: body.read(size), b""))
+                self.assertEqual(content.replace(boundary(body), b"BOUNDARY"), expected)
+                self.assertEqual(body.tell(), len(body))
+                self.assertEqual(body.read(), b"")
+
+    def test_digest(self):
+        with self.body() as body:
+            self.assertIsNone(body.hexdigest())
+            for _ in body:
+                pass
+            self.assertEqual(body.hexdigest(), hashlib.sha256(self.data).hexdigest())
+
+    def test_seek(self):
+        with self.body() as body:
+            content = body.read()
+            self.assertEqual(body.seek(0), 0)
+            self.assertEqual(body.read(), content)
+            self.assertEqual(body.hexdigest(), hashlib.sha256(self.data).hexdigest())
+            self.assertEqual(body.seek(-10, io.SEEK_END), len(body) - 10)
+            self.assertEqual(body.read(), content[-10:])
+            body.seek(1000)
+            body.seek(10, io.SEEK_CUR)
+            self.assertEqual(body.read(20), content[1010:1030])
+            # the file was not read from its beginning
+            body.read()
+            self.assertIsNone(body.hexdigest())
+            body.seek(0)
+            body.read()
+            self.assertEqual(body.hexdigest(), hashlib.sha256(self.data).hexdigest())
+
+    def test_truncated_file(self):
+        with self.body() as body:
+            body.read(1000)
+            with open(self.filepath, "r+b") as f:
+                f.truncate(500)
+            with self.assertRaises(IOError):
+                body.read()
+
+
+def boundary(body: MultipartFile) -> bytes:
+    return body.content_type.partition("boundary=")[2].encode()
@@ -0,0 +1,91 @@
+import json
+import unittest
+
+from nexussdk.utils.pagination import iter_results, iter_results_resumable
+
+
+class _Listing:
+    """
+        Listing of 0..total-1 paginated with from/size up to from_limit, then with _next links only.
+    """
+
+    def __init__(self, total: int, from_limit: int = 10 ** 9, next_links: bool = True):
+        self.total = total
+        self.from_limit = from_limit
+        self.next_links = next_links
+        self.requests = []
+
+    def page(self, start: int, size: int):
+        results = [{"@id": i} for i in range(start, min(start + size, self.total))]
+        page = {"_total": self.total, "_results": results}
+        if self.next_links and start + size < self.total:
+            page["_next"] = "next?after=%d&size=%d" % (start + size - 1, size)
+        return page
+
+    def fetch_page(self, start: int, size: int):
+        self.requests.append(("from", start))
+        if start > self.from_limit:
+            raise ValueError("from is limited to %d" % self.from_limit)
+        return self.page(start, size)
+
+    # Http
+    asynchronous = False
+
+    def require_sync(self, feature: str) -> None:
+        pass
+
+    def get(self, url: str):
+        self.requests.append(("next", url))
+        after, size = (int(v.split("=")[1]) for v in url.split("?")[1].split("&"))
+        return self.page(after + 1, size)
+
+
+class TestIterResults(unittest.TestCase):
+
+    def test_from_size(self):
+        for total in (0, 1, 19, 20, 21, 95):
+            listing = _Listing(total, next_links=False)
+            ids = [r["@id"] for r in iter_results(listing, listing.fetch_page, pagination_size=20)]
+            self.assertEqual(ids, list(range(total)))
+
+    def test_next_links(self):
+        listing = _Listing(95, from_limit=0)
+        ids = [r["@id"] for r in iter_results(listing, listing.fetch_page, pagination_size=20, max_pages=3)]
+        self.assertEqual(ids, list(range(95)))
+        self.assertEqual(len(listing.requests), 5)
+
+
+class TestIterResultsResumable(unittest.TestCase):
+
+    def test_cursors_resume_after_each_element(self):
+        listing = _Listing(47, from_limit=0)
+        items = list(iter_results_resumable(listing, listing.fetch_page, pagination_size=10))
+        self.assertEqual([r["@id"] for r, _ in items], list(range(47)))
+        for index, (_, cursor) in enumerate(items):
+            # the cursors are JSON documents
+            cursor = json.loads(json.dumps(cursor))
+            rest = iter_results_resumable(listing, listing.fetch_page, cursor, pagination_size=10)
+            self.assertEqual([r["@id"] for r, _ in rest], list(range(index + 1, 47)))
+
+    def test_cursor_beyond_the_from_limit(self):
+        listing = _Listing(100, from_limit=30)
+        items = list(iter_results_resumable(listing, listing.fetch_page, pagination_size=20, max_pages=2))
+        _, cursor = items[64]
+        self.assertIn("next", cursor)
+        listing.requests = []
+        rest = list(iter_results_resumable(listing, listing.fetch_page, cursor, pagination_size=20))
+        self.assertEqual([r["@id"] for r, _ in rest], list(range(65, 100)))
+        # resumed from the _next link of the page, never with from
+        self.assertTrue(all(kind == "next" for kind, _ in listing.requests))
+
+    def test_from_cursors(self):
+        listing = _Listing(25, next_links=False)
+        items = list(iter_results_resumable(listing, listing.fetch_page, pagination_size=10))
+        self.assertEqual(items[12][1], {"from": 10, "consumed": 3})
+        rest = iter_results_resumable(listing, listing.fetch_page, items[12][1], pagination_size=10)
+        self.assertEqual([r["@id"] for r, _ in rest], list(range(13, 25)))
+
+    def test_end_of_the_listing(self):
+        listing = _Listing(20, from_limit=0)
+        items = list(iter_results_resumable(listing, listing.fetch_page, pagination_size=10))
+        self.assertEqual(list(iter_results_resumable(listing, listing.fetch_page, items[-1][1], 10)), [])
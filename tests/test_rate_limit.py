@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from nexussdk.utils.rate_limit import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_async_max_in_flight(self):
+        limiter = RateLimiter(max_in_flight=4)
+        state = {"in_flight": 0, "max": 0}
+
+        async def request():
+            async with limiter.async_slot():
+                state["in_flight"] += 1
+                state["max"] = max(state["max"], state["in_flight"])
+                await asyncio.sleep(0.001)
+                state["in_flight"] -= 1
+
+        async def main():
+            await asyncio.gather(*(request() for _ in range(500)))
+
+        asyncio.run(main())
+        self.assertEqual(state["max"], 4)
+        self.assertEqual(limiter.stats()["requests"], 500)
+        self.assertEqual(limiter._in_flight, 0)
+        self.assertFalse(limiter._async_waiters)
+
+    def test_async_waiters_do_not_poll(self):
+        limiter = RateLimiter(max_in_flight=1)
+        entered = []
+        original = limiter._async_enter
+
+        async def counted_enter():
+            entered.append(None)
+            await original()
+
+        limiter._async_enter = counted_enter
+
+        async def main():
+            async with limiter.async_slot():
+                waiters = [asyncio.ensure_future(hold(limiter)) for _ in range(100)]
+                await asyncio.sleep(0.2)
+                # the waiting coroutines are suspended until a place is freed
+                self.assertEqual(len(limiter._async_waiters), 100)
+            await asyncio.gather(*waiters)
+
+        asyncio.run(main())
+        self.assertEqual(len(entered), 101)
+
+    def test_async_cancelled_waiter_passes_its_place(self):
+        limiter = RateLimiter(max_in_flight=1)
+
+        async def main():
+            async with limiter.async_slot():
+                first = asyncio.ensure_future(hold(limiter))
+                second = asyncio.ensure_future(hold(limiter))
+                await asyncio.sleep(0.01)
+            # the first waiter is woken, then cancelled before it takes the place
+            first.cancel()
+            await asyncio.wait_for(second, 1)
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+
+        asyncio.run(main())
+        self.assertEqual(limiter._in_flight, 0)
+
+    def test_threads_and_coroutines_share_the_limit(self):
+        limiter = RateLimiter(max_in_flight=2)
+        lock = threading.Lock()
+        state = {"in_flight": 0, "max": 0}
+
+        def enter():
+            with lock:
+                state["in_flight"] += 1
+                state["max"] = max(state["max"], state["in_flight"])
+
+        def leave():
+            with lock:
+                state["in_flight"] -= 1
+
+        def thread_requests():
+            for _ in range(20):
+                with limiter.slot():
+                    enter()
+                    time.sleep(0.001)
+                    leave()
+
+        async def request():
+            async with limiter.async_slot():
+                enter()
+                await asyncio.sleep(0.001)
+                leave()
+
+        async def main():
+            await asyncio.gather(*(request() for _ in range(100)))
+
+        threads = [threading.Thread(target=thread_requests) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        asyncio.run(main())
+        for thread in threads:
+            thread.join()
+        self.assertEqual(state["max"], 2)
+        self.assertEqual(limiter._in_flight, 0)
+
+    def test_rate(self):
+        limiter = RateLimiter(rate=100, burst=1)
+        started = time.monotonic()
+        for _ in range(21):
+            with limiter.slot():
+                pass
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+
+
+async def hold(limiter: RateLimiter):
+    async with limiter.async_slot():
+        await asyncio.sleep(0)
@@ -72,6 +72,13 @@ class TestResources(unittest.TestCase):
         payload = self.nexus.resources.add_attachement(payload, f)
         pretty_print(payload)
 
+    def test_create_many(self):
+        payloads = ({"index": i} for i in range(10))
+        results = list(self.nexus.resources.create_many(self.org, self.prj, payloads, workers=4))
+        self.assertEqual([index for index, _ in results], list(range(10)))
+        for _, payload in results:
+            self.assertEqual(payload["_rev"], 1)
+
     def test_list(self):
         self._post()
         self._put()
@@ -82,3 +89,14 @@ class TestResources(unittest.TestCase):
 
         payload = self.nexus.resources.list(self.org, self.prj, schema="context")
         self.assertEqual(len(payload["_results"]), 0)
+
+    def test_iter_list(self):
+        for i in range(5):
+            self.nexus.resources.create(self.org, self.prj, self.data)
+        time.sleep(10)
+        total = self.nexus.resources.list(self.org, self.prj)["_total"]
+        for max_pages in (1, 2):
+            listed = [r["@id"] for r in self.nexus.resources.iter_list(self.org, self.prj, pagination_size=2,
+                                                                       max_pages=max_pages)]
+            self.assertEqual(len(set(listed)), len(listed))
+            self.assertEqual(len(listed), total)
@@ -0,0 +1,99 @@
+import email.utils
+import time
+import unittest
+
+from nexussdk.utils.retry import RetryPolicy, _parse_retry_after
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retried_status_codes(self):
+        retry = RetryPolicy(backoff_factor=0.5)
+        for status in (429, 502, 503, 504):
+            delay = retry.delay("GET", 0, 0.0, status)
+            self.assertIsNotNone(delay)
+            self.assertTrue(0 <= delay <= 0.5)
+        for status in (400, 404, 409, 500):
+            self.assertIsNone(retry.delay("GET", 0, 0.0, status))
+
+    def test_connection_errors(self):
+        retry = RetryPolicy()
+        self.assertIsNotNone(retry.delay("GET", 0, 0.0))
+        self.assertIsNotNone(retry.delay("GET", 0, 0.0, sent=False))
+
+    def test_total(self):
+        retry = RetryPolicy(total=2)
+        self.assertIsNotNone(retry.delay("GET", 1, 0.0, 503))
+        self.assertIsNone(retry.delay("GET", 2, 0.0, 503))
+        self.assertIsNone(RetryPolicy(total=0).delay("GET", 0, 0.0, 503))
+
+    def test_methods(self):
+        retry = RetryPolicy()
+        self.assertIsNone(retry.delay("POST", 0, 0.0, 503))
+        self.assertIsNone(retry.delay("PATCH", 0, 0.0))
+        self.assertIsNotNone(retry.delay("head", 0, 0.0, 502))
+        self.assertIsNotNone(RetryPolicy(methods=None).delay("POST", 0, 0.0, 502))
+
+    def test_conditional_methods(self):
+        retry = RetryPolicy()
+        for method in ("PUT", "DELETE"):
+            # the request was not processed
+            self.assertIsNotNone(retry.delay(method, 0, 0.0, 429))
+            self.assertIsNotNone(retry.delay(method, 0, 0.0, 503))
+            self.assertIsNotNone(retry.delay(method, 0, 0.0, sent=False))
+            # the request may have been processed
+            self.assertIsNone(retry.delay(method, 0, 0.0, 502))
+            self.assertIsNone(retry.delay(method, 0, 0.0, 504))
+            self.assertIsNone(retry.delay(method, 0, 0.0))
+        self.assertIsNotNone(RetryPolicy(conditional_methods=()).delay("PUT", 0, 0.0, 502))
+
+    def test_backoff(self):
+        retry = RetryPolicy(total=10, backoff_factor=1.0, backoff_max=4.0, max_elapsed=None)
+        for retries, bound in ((0, 1.0), (1, 2.0), (2, 4.0), (5, 4.0)):
+            delays = [retry.delay("GET", retries, 0.0, 503) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= bound for d in delays))
+            # full jitter
+            self.assertGreater(max(delays) - min(delays), bound / 4)
+
+    def test_max_elapsed(self):
+        retry = RetryPolicy(backoff_factor=0.001, max_elapsed=10.0)
+        self.assertIsNotNone(retry.delay("GET", 0, 5.0, 503))
+        self.assertIsNone(retry.delay("GET", 0, 10.0, 503))
+        self.assertIsNone(retry.delay("GET", 0, 5.0, 503, retry_after="6"))
+        self.assertIsNotNone(RetryPolicy(max_elapsed=None).delay("GET", 0, 1e6, 503))
+
+    def test_retry_after(self):
+        retry = RetryPolicy()
+        self.assertEqual(retry.delay("GET", 0, 0.0, 429, retry_after="7"), 7.0)
+        self.assertEqual(retry.delay("PUT", 0, 0.0, 503, retry_after="0"), 0.0)
+        # an invalid header is ignored
+        self.assertLessEqual(retry.delay("GET", 0, 0.0, 429, retry_after="soon"), 0.5)
+        self.assertLessEqual(RetryPolicy(respect_retry_after=False).delay("GET", 0, 0.0, 429, retry_after="7"), 0.5)
+
+    def test_stats(self):
+        retry = RetryPolicy()
+        retry.record(0, 0.0, True)
+        retry.record(2, 1.5, True)
+        retry.record(3, 2.0, False)
+        self.assertEqual(retry.stats(), {"requests": 3, "retried_requests": 2, "retries": 5, "exhausted": 1,
+                                         "retry_seconds": 3.5})
+        retry.reset_stats()
+        self.assertEqual(retry.stats(), {"requests": 0, "retried_requests": 0, "retries": 0, "exhausted": 0,
+                                         "retry_seconds": 0.0})
+
+
+class TestParseRetryAfter(unittest.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(_parse_retry_after("120"), 120.0)
+        self.assertEqual(_parse_retry_after("1.5"), 1.5)
+        self.assertEqual(_parse_retry_after("-3"), 0.0)
+
+    def test_http_date(self):
+        future = email.utils.formatdate(time.time() + 30, usegmt=True)
+        self.assertAlmostEqual(_parse_retry_after(future), 30, delta=2)
+        self.assertEqual(_parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_invalid(self):
+        self.assertIsNone(_parse_retry_after("later"))
+        self.assertIsNone(_parse_retry_after(""))
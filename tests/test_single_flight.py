@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from nexussdk.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_identical_calls_in_flight_are_coalesced(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        executions = []
+        results = []
+
+        def call():
+            executions.append(None)
+            release.wait(5)
+            return {"items": [1, 2]}
+
+        def caller(index):
+            result = flight.do("key", call)
+            # each caller owns its result
+            result["items"].append(index)
+            results.append(result)
+
+        threads = [threading.Thread(target=caller, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        while flight.stats()["calls"] < 8:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(executions), 1)
+        self.assertEqual(sorted(r["items"][2] for r in results), list(range(8)))
+        self.assertTrue(all(len(r["items"]) == 3 for r in results))
+        self.assertEqual(flight.stats(), {"calls": 8, "coalesced": 7})
+
+    def test_completed_calls_are_executed_again(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+        self.assertEqual(flight.do("key", lambda: 2), 2)
+        self.assertEqual(flight.do("other", lambda: 3), 3)
+        self.assertEqual(flight.stats()["coalesced"], 0)
+
+    def test_exceptions_are_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def call():
+            release.wait(5)
+            raise ValueError("failed")
+
+        def caller():
+            try:
+                flight.do("key", call)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=caller) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while flight.stats()["calls"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(flight.do("key", lambda: "again"), "again")
+
+    def test_async_calls_are_coalesced(self):
+        flight = SingleFlight()
+        executions = []
+
+        async def call():
+            executions.append(None)
+            await asyncio.sleep(0.01)
+            return {"items": [1]}
+
+        async def main():
+            results = await asyncio.gather(*(flight.do_async("key", call) for _ in range(5)))
+            results[0]["items"].append(2)
+            return results, await flight.do_async("key", call)
+
+        results, again = asyncio.run(main())
+        self.assertEqual(len(executions), 2)
+        self.assertEqual([r["items"] for r in results], [[1, 2]] + [[1]] * 4)
+        self.assertEqual(again, {"items": [1]})
+        self.assertEqual(flight.stats(), {"calls": 6, "coalesced": 4})
+
+    def test_async_exceptions_are_shared(self):
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        async def main():
+            return await asyncio.gather(*(flight.do_async("key", call) for _ in range(3)), return_exceptions=True)
+
+        outcomes = asyncio.run(main())
+        self.assertTrue(all(isinstance(outcome, ValueError) for outcome in outcomes))
+        self.assertFalse(flight._futures)